@@ -24,9 +24,16 @@ import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter import ttk
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable, List, Tuple
+import io
 import os
+import hashlib
+import queue
+import re
+import shutil
 import sys
 
 
@@ -35,37 +42,225 @@ ENCODING_OPTIONS = (
     "Latin-1",
 )
 
+# Chunk size for streaming copies on the binary fast path.
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Coalescing buffer is flushed to the raw output fd once it crosses this size.
+_FLUSH_THRESHOLD = 4 * 1024 * 1024
+
+# Read-ahead pipeline: pool size and how many files may be in flight.
+_READ_WORKERS = 8
+_READ_WINDOW = 16
+
+
+class _CoalescingWriter:
+    """Accumulate writes in a bytearray and flush via os.write on a raw fd.
+
+    Replaces the BufferedWriter stack on the output file: headers,
+    separators and small files coalesce with adjacent content into a
+    single syscall instead of one Python-level write each.
+    """
+
+    def __init__(self, fd: int) -> None:
+        self._fd = fd
+        self._buf = bytearray()
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def write(self, data) -> int:
+        self._buf += data
+        if len(self._buf) >= _FLUSH_THRESHOLD:
+            self.flush()
+        return len(data)
+
+    def flush(self) -> None:
+        if not self._buf:
+            return
+        view = memoryview(self._buf)
+        try:
+            offset = 0
+            while offset < len(self._buf):
+                offset += os.write(self._fd, view[offset:])
+        finally:
+            view.release()
+        self._buf.clear()
+
+
+# Rows rendered beyond the visible viewport in the virtual listbox.
+_VIEW_PAD = 5
+
+
+class _VirtualListbox(tk.Listbox):
+    """Listbox that keeps its items in Python and renders only the viewport.
+
+    Tcl holds O(visible) strings instead of O(total), so inserting or
+    scrolling a list of tens of thousands of paths stays instant. The
+    public index API (insert/delete/curselection/selection_set/see) works
+    in virtual (full-list) coordinates, so callers use it like a normal
+    Listbox.
+    """
+
+    def __init__(self, master, **kwargs) -> None:
+        self._items: list[str] = []
+        self._sel: set[int] = set()
+        self._top = 0
+        self._ycmd = kwargs.pop("yscrollcommand", None)
+        super().__init__(master, **kwargs)
+        self.bind("<<ListboxSelect>>", self._sync_selection, add=True)
+        self.bind("<Configure>", lambda _e: self._render(), add=True)
+        # Route scrolling through the virtual window; the Tcl class bindings
+        # would otherwise scroll only the rendered slice.
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>", "<Prior>", "<Next>"):
+            self.bind(seq, self._on_scroll_event)
+
+    # Data API (virtual coordinates)
+    def insert(self, index, *elements) -> None:
+        if not elements:
+            return
+        items = [str(e) for e in elements]
+        if index == tk.END:
+            self._items.extend(items)
+        else:
+            i = int(index)
+            self._items[i:i] = items
+        self._render()
+
+    def delete(self, first, last=None) -> None:
+        if last == tk.END:
+            start, stop = int(first), len(self._items)
+        elif last is None:
+            start, stop = int(first), int(first) + 1
+        else:
+            start, stop = int(first), int(last) + 1
+        del self._items[start:stop]
+        removed = stop - start
+        self._sel = {
+            i if i < start else i - removed for i in self._sel if not start <= i < stop
+        }
+        self._clamp_top()
+        self._render()
+
+    def size(self) -> int:
+        return len(self._items)
+
+    def curselection(self):
+        return tuple(sorted(self._sel))
+
+    def selection_set(self, first, last=None) -> None:
+        stop = int(last) if last is not None else int(first)
+        self._sel.update(range(int(first), stop + 1))
+        self._render()
+
+    def selection_clear(self, first, last=None) -> None:
+        if last == tk.END:
+            start, stop = int(first), len(self._items)
+        elif last is None:
+            start, stop = int(first), int(first) + 1
+        else:
+            start, stop = int(first), int(last) + 1
+        self._sel -= set(range(start, stop))
+        self._render()
+
+    def see(self, index) -> None:
+        i = int(index)
+        rows = self._visible_rows()
+        if not self._top <= i < self._top + rows:
+            self._top = i - rows // 2
+            self._clamp_top()
+            self._render()
+
+    # Scrolling
+    def yview(self, *args):
+        if not args:
+            return self._fractions()
+        if args[0] == "moveto":
+            self._top = int(float(args[1]) * len(self._items))
+        elif args[0] == "scroll":
+            step = self._visible_rows() if str(args[2]).startswith("page") else 1
+            self._top += int(args[1]) * step
+        self._clamp_top()
+        self._render()
+
+    def configure(self, cnf=None, **kw):
+        if isinstance(cnf, dict):
+            kw.update(cnf)
+            cnf = None
+        if "yscrollcommand" in kw:
+            self._ycmd = kw.pop("yscrollcommand")
+        if cnf is not None or kw:
+            return super().configure(cnf, **kw)
+
+    config = configure
+
+    # Internals
+    def _on_scroll_event(self, event):
+        if event.keysym == "Prior":
+            self.yview("scroll", -1, "pages")
+        elif event.keysym == "Next":
+            self.yview("scroll", 1, "pages")
+        elif getattr(event, "num", None) == 4:
+            self.yview("scroll", -3, "units")
+        elif getattr(event, "num", None) == 5:
+            self.yview("scroll", 3, "units")
+        else:
+            self.yview("scroll", -3 if event.delta > 0 else 3, "units")
+        return "break"
+
+    def _sync_selection(self, _event=None) -> None:
+        # Fold the widget's (viewport-local) selection back into virtual
+        # coordinates, preserving selection outside the rendered window.
+        start = self._top
+        end = start + tk.Listbox.size(self)
+        local = {start + int(i) for i in tk.Listbox.curselection(self)}
+        self._sel = {i for i in self._sel if not start <= i < end} | local
+
+    def _visible_rows(self) -> int:
+        try:
+            bbox = tk.Listbox.bbox(self, 0)
+            row_h = bbox[3] if bbox else 0
+        except tk.TclError:
+            row_h = 0
+        if row_h <= 0:
+            row_h = 16
+        return max(1, self.winfo_height() // row_h)
+
+    def _clamp_top(self) -> None:
+        max_top = max(0, len(self._items) - self._visible_rows())
+        self._top = min(max(0, self._top), max_top)
+
+    def _fractions(self):
+        total = len(self._items)
+        if total == 0:
+            return (0.0, 1.0)
+        top = self._top / total
+        bottom = min(1.0, (self._top + self._visible_rows()) / total)
+        return (top, bottom)
+
+    def _render(self) -> None:
+        start = self._top
+        end = min(len(self._items), start + self._visible_rows() + _VIEW_PAD)
+        tk.Listbox.delete(self, 0, tk.END)
+        if end > start:
+            tk.Listbox.insert(self, tk.END, *self._items[start:end])
+        for i in self._sel:
+            if start <= i < end:
+                tk.Listbox.selection_set(self, i - start)
+        if self._ycmd:
+            self._ycmd(*self._fractions())
+
+
+# Recognized escapes for unescape_separators; one C-level scan via re.sub.
+_ESC_RE = re.compile(r"\\([nrt\\])")
+_ESC_MAP = {"n": "\n", "r": "\r", "t": "\t", "\\": "\\"}
+
 
 def unescape_separators(text: str) -> str:
     """Interpret common backslash escapes in a small, safe way.
 
-    Supports: \n, \r, \t, \\\n+    Other sequences remain as-is.
+    Supports: \\n, \\r, \\t, \\\\. Other sequences remain as-is.
     """
-    out = []
-    i = 0
-    while i < len(text):
-        ch = text[i]
-        if ch == "\\" and i + 1 < len(text):
-            nxt = text[i + 1]
-            if nxt == "n":
-                out.append("\n")
-                i += 2
-                continue
-            if nxt == "r":
-                out.append("\r")
-                i += 2
-                continue
-            if nxt == "t":
-                out.append("\t")
-                i += 2
-                continue
-            if nxt == "\\":
-                out.append("\\")
-                i += 2
-                continue
-        out.append(ch)
-        i += 1
-    return "".join(out)
+    return _ESC_RE.sub(lambda m: _ESC_MAP[m.group(1)], text)
 
 
 def scan_txt_files(folder: Path, recursive: bool) -> List[Path]:
@@ -73,32 +268,43 @@ def scan_txt_files(folder: Path, recursive: bool) -> List[Path]:
 
     If recursive is True, walks subfolders; otherwise scans only the top level.
     Returned list is sorted by path for predictability.
+
+    Uses os.scandir so file-vs-dir checks come from the cached DirEntry
+    instead of one stat syscall per entry. Symlinked .txt files are
+    included (the DirEntry caches the follow-symlink stat too); symlinked
+    directories are not descended into, matching os.walk's default.
     """
     folder = folder.resolve()
     results: List[Path] = []
     if not folder.exists() or not folder.is_dir():
         return results
-    if recursive:
-        for root, _dirs, files in os.walk(folder):
-            root_path = Path(root)
-            for name in files:
-                if name.lower().endswith(".txt"):
-                    results.append((root_path / name).resolve())
-    else:
-        for p in folder.iterdir():
-            if p.is_file() and p.name.lower().endswith(".txt"):
-                results.append(p.resolve())
+
+    stack = [os.fspath(folder)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.name.lower().endswith(".txt") and entry.is_file():
+                        results.append(Path(entry.path))
+                except OSError:
+                    continue
     # Sort for stable ordering
     results.sort(key=lambda p: str(p).lower())
     return results
 
 
-def _read_file_text(path: Path, encoding_label: str) -> str:
-    """Read a file as text according to selected encoding policy.
+def _open_text_stream(path: Path, encoding_label: str) -> io.TextIOWrapper:
+    """Open path for chunked text reading per the selected encoding policy.
 
-    - UTF-8 (replace errors): encoding="utf-8", errors="replace"
-    - Latin-1: encoding="latin-1"
-    Normalizes line endings to "\n".
+    newline=None gives streaming universal-newlines translation, so no
+    whole-string replace pass is needed afterwards.
     """
     if encoding_label.startswith("UTF-8"):
         enc = "utf-8"
@@ -106,10 +312,190 @@ def _read_file_text(path: Path, encoding_label: str) -> str:
     else:
         enc = "latin-1"
         errors = "strict"
-    with path.open("r", encoding=enc, errors=errors, newline=None) as f:
-        text = f.read()
-    # newline=None already converts to \n, but normalize explicitly for safety
-    return text.replace("\r\n", "\n").replace("\r", "\n")
+    return io.TextIOWrapper(
+        open(path, "rb", buffering=0), encoding=enc, errors=errors, newline=None
+    )
+
+
+def _stream_text(src, out_f) -> int:
+    """Copy src to the binary out_f in chunks, transcoding to UTF-8.
+
+    Returns the number of bytes written. Peak memory stays at one chunk
+    instead of the whole file. Method lookups are hoisted out of the loop
+    so each 1 MiB chunk pays only the C-level read/encode/write calls.
+    """
+    read = src.read
+    write = out_f.write
+    written = 0
+    while chunk := read(_COPY_CHUNK_SIZE):
+        buf = chunk.encode("utf-8")
+        write(buf)
+        written += len(buf)
+    return written
+
+
+def _sniff_needs_text_path(first_chunk: bytes) -> bool:
+    """Return True if a UTF-8 file's first chunk rules out a raw byte copy.
+
+    A raw copy is wrong when the file needs CRLF/CR normalization or when
+    the bytes aren't clean UTF-8 (errors="replace" must kick in). A decode
+    error caused by a character split at the chunk boundary also lands here;
+    the text path handles that correctly, just slower.
+    """
+    if b"\r" in first_chunk:
+        return True
+    try:
+        first_chunk.decode("utf-8")
+    except UnicodeDecodeError:
+        return True
+    return False
+
+
+# Prefetched files above this size are streamed by the writer instead of
+# being read whole by a worker, keeping pending memory bounded.
+_PREFETCH_MAX = 32 * 1024 * 1024
+
+# Sentinel: the worker decided the file is too large to hold in memory.
+_STREAM_LARGE = object()
+
+
+def _read_file_bytes_encoded(path: Path, encoding_label: str):
+    """Read path fully and return its content as UTF-8 bytes.
+
+    Returns the encoded bytes, _STREAM_LARGE for files too big to prefetch
+    whole, or None for missing/unreadable files. Clean UTF-8 input without
+    CR line endings is passed through without a decode/encode round-trip.
+    """
+    try:
+        # No exists()/is_file() pre-checks: open() raises for missing paths
+        # and directories, so the happy path costs one syscall, not three.
+        with open(path, "rb", buffering=0) as src:
+            if os.fstat(src.fileno()).st_size > _PREFETCH_MAX:
+                return _STREAM_LARGE
+            raw = src.read()
+        if encoding_label.startswith("UTF-8"):
+            if not _sniff_needs_text_path(raw):
+                return raw
+            text = raw.decode("utf-8", errors="replace")
+        else:
+            text = raw.decode("latin-1")
+        return text.replace("\r\n", "\n").replace("\r", "\n").encode("utf-8")
+    except (OSError, UnicodeError):
+        return None
+
+
+# Zero-copy path: os.sendfile moves bytes kernel-side, skipping the
+# user-space buffer entirely. Linux-only; other platforms restrict the
+# destination to sockets.
+_USE_SENDFILE = sys.platform == "linux" and hasattr(os, "sendfile")
+
+
+def _stream_file(path: Path, encoding_label: str, out_f) -> int:
+    """Stream one (large) file into out_f, returning bytes written."""
+    if encoding_label.startswith("UTF-8"):
+        with open(path, "rb", buffering=0) as src:
+            # Sniff the whole file, not just its head: CRLF or invalid
+            # UTF-8 past the first chunk must get the same normalization a
+            # small prefetched file would, so output never depends on file
+            # size. The extra read pass warms the page cache the raw copy
+            # then hits. A chunk boundary splitting a multi-byte character
+            # also lands on the text path; correct, just slower.
+            clean = True
+            while chunk := src.read(_COPY_CHUNK_SIZE):
+                if _sniff_needs_text_path(chunk):
+                    clean = False
+                    break
+            src.seek(0)
+            if clean:
+                size = os.fstat(src.fileno()).st_size
+                if _USE_SENDFILE and size > 0:
+                    offset = 0
+                    try:
+                        out_f.flush()
+                        while offset < size:
+                            sent = os.sendfile(
+                                out_f.fileno(), src.fileno(), offset, size - offset
+                            )
+                            if sent == 0:
+                                break
+                            offset += sent
+                        return offset
+                    except OSError:
+                        # Non-regular file or unsupported fs; fall back to
+                        # the user-space copy from where sendfile stopped.
+                        src.seek(offset)
+                shutil.copyfileobj(src, out_f, length=_COPY_CHUNK_SIZE)
+                return os.fstat(src.fileno()).st_size
+            text_src = io.TextIOWrapper(
+                src, encoding="utf-8", errors="replace", newline=None
+            )
+            return _stream_text(text_src, out_f)
+    with _open_text_stream(path, encoding_label) as src:
+        return _stream_text(src, out_f)
+
+
+def _hash_prefix(path: Path, length: int = 4096) -> bytes:
+    """Hash just the first few KiB of path — a cheap collision prefilter."""
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(length), digest_size=16).digest()
+
+
+def _hash_full(path: Path) -> bytes:
+    """Hash the whole file in chunks."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb", buffering=0) as f:
+        while chunk := f.read(_COPY_CHUNK_SIZE):
+            h.update(chunk)
+    return h.digest()
+
+
+def _dedupe_by_content(files: List[Path]) -> Tuple[List[Path], List[Path]]:
+    """Drop files whose content duplicates an earlier file in the list.
+
+    Uses the size → prefix-hash → full-hash pipeline: full content is only
+    hashed for files that still collide after the cheaper stages, so unique
+    files cost one stat and at most one 4 KiB read. Returns
+    (kept_in_order, duplicates). Unreadable files are kept; the combine
+    loop reports those as skipped.
+    """
+    by_size: dict = {}
+    for p in files:
+        try:
+            by_size.setdefault(os.stat(p).st_size, []).append(p)
+        except OSError:
+            continue
+
+    content_key: dict = {}
+    for size, group in by_size.items():
+        if len(group) < 2:
+            continue
+        by_prefix: dict = {}
+        for p in group:
+            try:
+                by_prefix.setdefault(_hash_prefix(p), []).append(p)
+            except OSError:
+                continue
+        for subgroup in by_prefix.values():
+            if len(subgroup) < 2:
+                continue
+            for p in subgroup:
+                try:
+                    content_key[p] = (size, _hash_full(p))
+                except OSError:
+                    continue
+
+    kept: List[Path] = []
+    duplicates: List[Path] = []
+    seen: set = set()
+    for p in files:
+        key = content_key.get(p)
+        if key is not None:
+            if key in seen:
+                duplicates.append(p)
+                continue
+            seen.add(key)
+        kept.append(p)
+    return kept, duplicates
 
 
 def combine_files(
@@ -118,12 +504,25 @@ def combine_files(
     encoding_label: str,
     add_headers: bool,
     separator: str,
+    dedupe_content: bool = False,
+    progress=None,
 ) -> Tuple[int, int, List[Path]]:
     """Combine file contents into output.
 
     Returns (files_count_written, total_bytes_written, skipped_files).
     Output is always UTF-8 encoded.
     Skips files that don't exist or aren't readable.
+
+    Reads are pipelined through a small thread pool (a sliding window of
+    files ahead of the writer) so read latency overlaps write throughput;
+    the writer consumes results in submission order, so output order is
+    unchanged.
+
+    With dedupe_content, files whose bytes duplicate an earlier file are
+    written once and reported through the skipped channel.
+
+    progress, if given, is called as progress(bytes_written, estimated_total)
+    once up front and then after each file, from the calling thread.
     """
     count = 0
     total_bytes = 0
@@ -132,29 +531,103 @@ def combine_files(
     # Ensure parent directory exists
     output.parent.mkdir(parents=True, exist_ok=True)
 
-    with output.open("w", encoding="utf-8", newline="") as out_f:
-        for idx, p in enumerate(files):
+    if dedupe_content:
+        files, duplicates = _dedupe_by_content(files)
+        skipped.extend(duplicates)
+
+    sep_bytes = separator.encode("utf-8")
+
+    # Estimate the combined size with one cheap stat pass so the filesystem
+    # can reserve contiguous extents up front. It's only an estimate (skips
+    # and newline normalization shrink it), so the file is truncated to the
+    # real size at the end.
+    est_size = 0
+    for p in files:
+        try:
+            est_size += os.stat(p).st_size
+        except OSError:
+            continue
+        if add_headers:
+            est_size += len(f"=== {p.name} ===\n".encode("utf-8"))
+    est_size += len(sep_bytes) * max(0, len(files) - 1)
+
+    if progress is not None:
+        progress(0, est_size)
+
+    # O_BINARY keeps the Windows CRT from translating \n to \r\n on write
+    fd = os.open(
+        os.fspath(output),
+        os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+        0o644,
+    )
+    preallocated = False
+    try:
+        if est_size > 0:
             try:
-                if not p.exists() or not p.is_file():
+                os.posix_fallocate(fd, 0, est_size)
+                preallocated = True
+            except (AttributeError, OSError):
+                pass
+
+        out_f = _CoalescingWriter(fd)
+        with ThreadPoolExecutor(max_workers=_READ_WORKERS) as executor:
+            pending: deque = deque()
+            file_iter = iter(files)
+
+            # Prime the sliding window of read-ahead futures.
+            for p in file_iter:
+                pending.append((p, executor.submit(_read_file_bytes_encoded, p, encoding_label)))
+                if len(pending) >= _READ_WINDOW:
+                    break
+
+            idx = 0
+            while pending:
+                p, future = pending.popleft()
+                body = future.result()
+
+                nxt = next(file_iter, None)
+                if nxt is not None:
+                    pending.append(
+                        (nxt, executor.submit(_read_file_bytes_encoded, nxt, encoding_label))
+                    )
+
+                if body is None:
                     skipped.append(p)
+                    idx += 1
+                    continue
+
+                try:
+                    if add_headers:
+                        header_bytes = f"=== {p.name} ===\n".encode("utf-8")
+                        out_f.write(header_bytes)
+                        total_bytes += len(header_bytes)
+
+                    if body is _STREAM_LARGE:
+                        total_bytes += _stream_file(p, encoding_label, out_f)
+                    else:
+                        out_f.write(body)
+                        total_bytes += len(body)
+                except Exception:
+                    skipped.append(p)
+                    idx += 1
                     continue
-                text = _read_file_text(p, encoding_label)
-            except Exception:
-                skipped.append(p)
-                continue
 
-            if add_headers:
-                header = f"=== {p.name} ===\n"
-                out_f.write(header)
-                total_bytes += len(header.encode("utf-8"))
+                count += 1
 
-            out_f.write(text)
-            total_bytes += len(text.encode("utf-8"))
-            count += 1
+                if idx != len(files) - 1 and separator:
+                    out_f.write(sep_bytes)
+                    total_bytes += len(sep_bytes)
+                idx += 1
 
-            if idx != len(files) - 1 and separator:
-                out_f.write(separator)
-                total_bytes += len(separator.encode("utf-8"))
+                if progress is not None:
+                    progress(total_bytes, est_size)
+
+        out_f.flush()
+        if preallocated:
+            # Trim whatever headroom the estimate over-reserved.
+            os.ftruncate(fd, os.lseek(fd, 0, os.SEEK_CUR))
+    finally:
+        os.close(fd)
 
     return count, total_bytes, skipped
 
@@ -168,22 +641,62 @@ class TextCombinerApp(tk.Tk):
 
         # State
         self.files: List[Path] = []
-        self.files_index: set[str] = set()  # for fast dedupe (case-insensitive)
+        # Dedup index stores 64-bit hashes of normalized paths, not the
+        # strings themselves (~10x smaller for huge lists). A collision at
+        # 64 bits is vanishingly rare and at worst drops one legitimate add,
+        # matching dedup behavior for identical paths.
+        self.files_index: set[int] = set()
         self.last_dir: Path | None = None
 
         # Tk variables
         self.include_subfolders_var = tk.BooleanVar(value=True)
         self.add_headers_var = tk.BooleanVar(value=False)
+        self.dedupe_content_var = tk.BooleanVar(value=False)
         self.encoding_var = tk.StringVar(value=ENCODING_OPTIONS[0])
         self.separator_var = tk.StringVar(value="\\n")  # default to blank line via escape
         self.output_path_var = tk.StringVar(value="")
         self.status_var = tk.StringVar(value="Ready")
 
+        # Debounce state for button refreshes
+        self._refresh_pending = False
+        self._last_btn_state: tuple | None = None
+
+        # Persistent combine worker: jobs are queued instead of spawning a
+        # fresh thread per combine.
+        self._jobs: queue.Queue = queue.Queue()
+        threading.Thread(target=self._worker_loop, daemon=True).start()
+
         # Build UI
         self._build_widgets()
         self._bind_events()
         self._refresh_buttons()
 
+    def _worker_loop(self) -> None:
+        """Drain combine jobs; results are marshalled back via after()."""
+        while True:
+            files, out_path, enc_label, add_headers, sep, dedupe = self._jobs.get()
+            # Throttle progress callbacks: only report when at least 1 MiB
+            # has been written since the last update (or at the endpoints).
+            last_reported = [-1]
+
+            def report(done: int, total: int) -> None:
+                if done - last_reported[0] >= _COPY_CHUNK_SIZE or done >= total:
+                    last_reported[0] = done
+                    self.after(0, self._set_progress, done, total)
+
+            try:
+                count, total_bytes, skipped = combine_files(
+                    files, out_path, enc_label, add_headers, sep,
+                    dedupe_content=dedupe, progress=report,
+                )
+                self.after(
+                    0, self._combine_complete, True, count, total_bytes, skipped, str(out_path)
+                )
+            except Exception as e:
+                self.after(0, self._combine_failed, e)
+            finally:
+                self._jobs.task_done()
+
     # UI construction
     def _build_widgets(self) -> None:
         pad = 8
@@ -207,10 +720,11 @@ class TextCombinerApp(tk.Tk):
         mid = ttk.Frame(self)
         mid.pack(fill=tk.BOTH, expand=True, padx=pad, pady=(4, 4))
 
-        self.lst_files = tk.Listbox(
+        self.lst_files = _VirtualListbox(
             mid,
             selectmode=tk.EXTENDED,
             activestyle="dotbox",
+            exportselection=False,
         )
         yscroll = ttk.Scrollbar(mid, orient=tk.VERTICAL, command=self.lst_files.yview)
         self.lst_files.configure(yscrollcommand=yscroll.set)
@@ -251,6 +765,11 @@ class TextCombinerApp(tk.Tk):
         self.chk_headers = ttk.Checkbutton(row1, text="Add filename headers", variable=self.add_headers_var)
         self.chk_headers.pack(side=tk.LEFT)
 
+        self.chk_dedupe = ttk.Checkbutton(
+            row1, text="Skip duplicate content", variable=self.dedupe_content_var
+        )
+        self.chk_dedupe.pack(side=tk.LEFT, padx=(pad, 0))
+
         ttk.Label(row1, text="Encoding:").pack(side=tk.LEFT, padx=(pad, 0))
         self.cmb_encoding = ttk.Combobox(row1, textvariable=self.encoding_var, values=ENCODING_OPTIONS, state="readonly", width=24)
         self.cmb_encoding.pack(side=tk.LEFT)
@@ -267,7 +786,7 @@ class TextCombinerApp(tk.Tk):
         bottom = ttk.Frame(self)
         bottom.pack(fill=tk.X, padx=pad, pady=(4, pad))
 
-        self.progress = ttk.Progressbar(bottom, mode="indeterminate")
+        self.progress = ttk.Progressbar(bottom, mode="determinate")
         self.progress.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         self.btn_combine = ttk.Button(bottom, text="Combine", command=self.on_combine)
@@ -289,43 +808,61 @@ class TextCombinerApp(tk.Tk):
         self.bind("<Control-Down>", lambda e: self.on_move(1))
 
     # State helpers
-    def _index_key(self, p: Path) -> str:
-        # Case-insensitive dedupe on Windows; case-sensitive elsewhere
-        key = str(p.resolve())
-        if os.name == "nt":
-            key = key.lower()
-        return key
+    def _index_key(self, p: Path) -> int:
+        # Case-insensitive dedupe on Windows; case-sensitive elsewhere.
+        # abspath+normcase is a pure string transform — no lstat per path
+        # component like Path.resolve() pays for symlink resolution.
+        key = os.path.normcase(os.path.abspath(os.fspath(p)))
+        # surrogatepass keeps undecodable filesystem names hashable
+        digest = hashlib.blake2b(
+            key.encode("utf-8", "surrogatepass"), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, "little")
 
     def _add_files(self, paths: Iterable[Path]) -> int:
-        added = 0
+        added: list[str] = []
         for p in paths:
             try:
-                rp = p.resolve()
+                key = self._index_key(p)
             except Exception:
                 continue
-            key = self._index_key(rp)
             if key in self.files_index:
                 continue
-            self.files.append(rp)
+            self.files.append(p)
             self.files_index.add(key)
-            added += 1
+            added.append(str(p))
         if added:
-            self._refresh_listbox()
+            # Append only the new rows; a full rebuild would be O(total).
+            self.lst_files.insert(tk.END, *added)
         self._refresh_buttons()
-        return added
+        return len(added)
 
     def _refresh_listbox(self) -> None:
         self.lst_files.delete(0, tk.END)
-        for p in self.files:
-            self.lst_files.insert(tk.END, str(p))
+        if self.files:
+            # One variadic insert is a single Tcl round-trip instead of N.
+            self.lst_files.insert(tk.END, *[str(p) for p in self.files])
 
     def _refresh_buttons(self) -> None:
+        # Coalesce bursts of variable traces (e.g. typing in the separator
+        # entry) into a single idle-time update instead of five Tcl calls
+        # per keystroke.
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.after_idle(self._refresh_buttons_now)
+
+    def _refresh_buttons_now(self) -> None:
+        self._refresh_pending = False
         can = bool(self.files) and bool(self.output_path_var.get())
+        have_files = bool(self.files)
+        state = (can, have_files)
+        if state == self._last_btn_state:
+            return
+        self._last_btn_state = state
         self.btn_combine.configure(state=(tk.NORMAL if can else tk.DISABLED))
-        self.btn_remove.configure(state=(tk.NORMAL if self.files else tk.DISABLED))
-        self.btn_clear.configure(state=(tk.NORMAL if self.files else tk.DISABLED))
-        self.btn_up.configure(state=(tk.NORMAL if self.files else tk.DISABLED))
-        self.btn_down.configure(state=(tk.NORMAL if self.files else tk.DISABLED))
+        for b in (self.btn_remove, self.btn_clear, self.btn_up, self.btn_down):
+            b.configure(state=(tk.NORMAL if have_files else tk.DISABLED))
 
     def _set_status(self, msg: str) -> None:
         self.status_var.set(msg)
@@ -436,20 +973,13 @@ class TextCombinerApp(tk.Tk):
 
         # Disable controls during work
         self._toggle_controls(False)
-        self.progress.start(10)
+        self.progress.configure(value=0)
         self._set_status("Combining…")
 
-        def worker():
-            try:
-                count, total_bytes, skipped = combine_files(
-                    self.files, out_path, enc_label, add_headers, sep
-                )
-                # re-enable in main thread
-                self.after(0, self._combine_complete, True, count, total_bytes, skipped, str(out_path))
-            except Exception as e:
-                self.after(0, self._combine_failed, e)
+        dedupe = bool(self.dedupe_content_var.get())
 
-        threading.Thread(target=worker, daemon=True).start()
+        # Snapshot the file list so later UI edits can't race the worker.
+        self._jobs.put((list(self.files), out_path, enc_label, add_headers, sep, dedupe))
 
     def _toggle_controls(self, enabled: bool) -> None:
         state = tk.NORMAL if enabled else tk.DISABLED
@@ -463,6 +993,7 @@ class TextCombinerApp(tk.Tk):
             self.btn_down,
             self.btn_output,
             self.chk_headers,
+            self.chk_dedupe,
             self.cmb_encoding,
             self.entry_separator,
             self.btn_combine,
@@ -471,11 +1002,17 @@ class TextCombinerApp(tk.Tk):
                 w.configure(state=state)
             except tk.TclError:
                 pass
+        # Widget states were forced directly; drop the refresh cache so the
+        # next _refresh_buttons recomputes them.
+        self._last_btn_state = None
+
+    def _set_progress(self, done: int, total: int) -> None:
+        if total > 0:
+            self.progress.configure(maximum=total, value=min(done, total))
 
     def _combine_complete(
         self, success: bool, count: int, total_bytes: int, skipped: List[Path], out_path: str
     ) -> None:
-        self.progress.stop()
         self._toggle_controls(True)
         self._refresh_buttons()
         msg = f"Combined {count} file(s). Wrote {total_bytes} bytes to:\n{out_path}"
@@ -485,7 +1022,6 @@ class TextCombinerApp(tk.Tk):
         self._set_status(msg.replace("\n", " "))
 
     def _combine_failed(self, err: Exception) -> None:
-        self.progress.stop()
         self._toggle_controls(True)
         self._refresh_buttons()
         messagebox.showerror("Error", f"Combine failed: {err}")
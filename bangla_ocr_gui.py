@@ -8,16 +8,74 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import os
 import threading
-from PIL import Image, ImageTk
-import pytesseract
-from pathlib import Path
+import queue
+import hashlib
+import io
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
-import webbrowser
+import tempfile
 import sys
 import shutil
 import platform
 
+# PIL, pytesseract, tesserocr and webbrowser are imported lazily inside the
+# functions that need them: together they add hundreds of ms and several MB
+# of RSS to startup, and none are needed just to draw the window.
+
+_tesserocr = None
+
+
+def _get_tesserocr():
+    """Resolve the optional tesserocr module on first use, or None.
+
+    The in-process API loads the language model once per batch instead of
+    forking the tesseract binary for every image.
+    """
+    global _tesserocr
+    if _tesserocr is None:
+        # Keep Tesseract's internal OpenMP threading from oversubscribing
+        # cores when several recognizers run in parallel; must be set before
+        # tesserocr loads.
+        os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+        try:
+            import tesserocr
+        except ImportError:
+            tesserocr = False
+        _tesserocr = tesserocr
+    return _tesserocr or None
+
+@functools.lru_cache(maxsize=32)
+def _probe_tesseract(path, mtime_ns):
+    """Spawn `tesseract --version` for path; memoized on path + mtime.
+
+    The probe costs a subprocess each time, and startup can fire it half a
+    dozen times across the same candidates.
+    """
+    import pytesseract
+    try:
+        pytesseract.pytesseract.tesseract_cmd = path
+        pytesseract.get_tesseract_version()
+        return True
+    except Exception:
+        return False
+
+
 class BanglaOCRGUI:
+    # Single source of truth for supported image types: the file dialogs and
+    # the folder scanner must agree on what counts as an image.
+    _IMG_EXTS = ('.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif')
+    _IMG_EXT_SET = frozenset(_IMG_EXTS)
+    _IMG_FILETYPES = [
+        ("Image files", " ".join('*' + e for e in _IMG_EXTS)),
+        ("All files", "*.*"),
+    ]
+
+    # Images per tesseract list-file invocation on the pytesseract path.
+    # Tesseract can stall on very long list files, so stay well below that.
+    _BATCH_CHUNK = 40
+
     def __init__(self, root):
         self.root = root
         self.root.title("বাংলা-ইংরেজি OCR সফটওয়্যার | Bengali-English OCR Software")
@@ -30,6 +88,19 @@ class BanglaOCRGUI:
         self.is_processing = False
         self.tesseract_available = False
         self.tesseract_path = None
+
+        # OCR result cache: identical image bytes + languages reuse the
+        # previous text instead of re-running Tesseract.
+        self._ocr_cache_dir = 'ocr_cache'
+        self._ocr_mem_cache = {}
+
+        # Worker threads queue UI updates here; a single periodic after()
+        # consumer batches them into the widgets.
+        self._ui_queue = deque()
+
+        # Settings writes are debounced and skipped when nothing changed
+        self._pending_save = None
+        self._last_saved_blob = None
         
         # Load settings (may include tesseract path), then check availability
         self.load_settings()
@@ -38,12 +109,9 @@ class BanglaOCRGUI:
         # Configure style
         self.setup_styles()
         
-        # Create GUI
+        # Create GUI; widgets pull their defaults from the parsed settings
         self.create_widgets()
 
-        # Load settings again to populate UI-bound values like output folder
-        self.load_settings()
-
         # If Tesseract isn't available, prompt configuration dialog
         if not self.tesseract_available:
             # Delay a bit to let main window show up
@@ -51,6 +119,12 @@ class BanglaOCRGUI:
     
     def check_tesseract(self):
         """Check and attempt to configure Tesseract availability."""
+        # Already configured and working; don't re-probe
+        if self.tesseract_available:
+            return
+
+        import pytesseract
+
         # 1) If we have a saved/explicit path, try that first
         if self.tesseract_path:
             pytesseract.pytesseract.tesseract_cmd = self.tesseract_path
@@ -106,52 +180,60 @@ class BanglaOCRGUI:
 
     def _test_tesseract_cmd(self, path_candidate):
         """Return True if path_candidate works for pytesseract."""
-        try:
-            if not path_candidate:
+        if not path_candidate:
+            return False
+        import pytesseract
+        # Reject obviously missing candidates without paying for a probe
+        # subprocess: explicit paths must exist, bare command names must be
+        # resolvable on PATH.
+        if os.sep in path_candidate or path_candidate.lower().endswith('.exe'):
+            if not os.path.isfile(path_candidate):
                 return False
+        elif shutil.which(path_candidate) is None:
+            return False
+        try:
+            mtime_ns = os.stat(path_candidate).st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        prior = pytesseract.pytesseract.tesseract_cmd
+        if _probe_tesseract(path_candidate, mtime_ns):
             pytesseract.pytesseract.tesseract_cmd = path_candidate
-            _ = pytesseract.get_tesseract_version()
             return True
-        except Exception:
-            return False
+        # A failed probe must not leave the broken path configured globally
+        pytesseract.pytesseract.tesseract_cmd = prior
+        return False
 
     def _set_tesseract_cmd(self, path_value, persist=True):
         """Set tesseract command, optionally persisting to settings."""
+        import pytesseract
         self.tesseract_path = path_value
         pytesseract.pytesseract.tesseract_cmd = path_value
         if persist:
-            self.save_settings()
+            self._schedule_save()
     
+    # ttk styles are process-global; configure them once per application
+    _styles_configured = False
+
     def setup_styles(self):
         """Configure modern styling for the application"""
+        if BanglaOCRGUI._styles_configured:
+            return
+        BanglaOCRGUI._styles_configured = True
+
         style = ttk.Style()
         style.theme_use('clam')
-        
-        # Configure colors
-        style.configure('Title.TLabel', 
-                       font=('Arial', 16, 'bold'), 
-                       foreground='#2c3e50',
-                       background='#f0f0f0')
-        
-        style.configure('Header.TLabel', 
-                       font=('Arial', 12, 'bold'), 
-                       foreground='#34495e',
-                       background='#f0f0f0')
-        
-        style.configure('Success.TLabel', 
-                       font=('Arial', 10), 
-                       foreground='#27ae60',
-                       background='#f0f0f0')
-        
-        style.configure('Error.TLabel', 
-                       font=('Arial', 10), 
-                       foreground='#e74c3c',
-                       background='#f0f0f0')
-        
-        style.configure('Warning.TLabel', 
-                       font=('Arial', 10, 'bold'), 
-                       foreground='#f39c12',
-                       background='#f0f0f0')
+
+        # Shared attributes with per-style overrides
+        common = dict(font=('Arial', 10), background='#f0f0f0')
+        overrides = {
+            'Title.TLabel': dict(font=('Arial', 16, 'bold'), foreground='#2c3e50'),
+            'Header.TLabel': dict(font=('Arial', 12, 'bold'), foreground='#34495e'),
+            'Success.TLabel': dict(foreground='#27ae60'),
+            'Error.TLabel': dict(foreground='#e74c3c'),
+            'Warning.TLabel': dict(font=('Arial', 10, 'bold'), foreground='#f39c12'),
+        }
+        for name, override in overrides.items():
+            style.configure(name, **{**common, **override})
     
     def create_widgets(self):
         """Create all GUI widgets"""
@@ -236,7 +318,7 @@ class BanglaOCRGUI:
         output_frame.columnconfigure(1, weight=1)
         
         ttk.Label(output_frame, text="Output Folder:", style='Header.TLabel').grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
-        self.output_var = tk.StringVar()
+        self.output_var = tk.StringVar(value=self._settings.get('output_folder', ''))
         output_entry = ttk.Entry(output_frame, textvariable=self.output_var, width=50)
         output_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(10, 10), pady=(0, 5))
         ttk.Button(output_frame, text="Browse", command=self.browse_output_folder).grid(row=0, column=2, pady=(0, 5))
@@ -354,6 +436,7 @@ class BanglaOCRGUI:
     
     def show_install_instructions(self):
         """Show installation instructions for Tesseract"""
+        import webbrowser
         instructions = """Tesseract OCR Installation Instructions:
 
 Windows:
@@ -411,10 +494,7 @@ Note: Bengali language support is required for Bengali text recognition."""
         """Browse for a single image file"""
         file_path = filedialog.askopenfilename(
             title="Select Image File",
-            filetypes=[
-                ("Image files", "*.jpg *.jpeg *.png *.bmp *.tiff *.tif"),
-                ("All files", "*.*")
-            ]
+            filetypes=self._IMG_FILETYPES
         )
         if file_path:
             self.single_image_var.set(file_path)
@@ -425,10 +505,7 @@ Note: Bengali language support is required for Bengali text recognition."""
         """Browse for multiple image files"""
         file_paths = filedialog.askopenfilenames(
             title="Select Multiple Image Files",
-            filetypes=[
-                ("Image files", "*.jpg *.jpeg *.png *.bmp *.tiff *.tif"),
-                ("All files", "*.*")
-            ]
+            filetypes=self._IMG_FILETYPES
         )
         if file_paths:
             self.multiple_images_var.set("; ".join(file_paths))
@@ -452,23 +529,33 @@ Note: Bengali language support is required for Bengali text recognition."""
     def get_input_files(self):
         """Get list of input files based on user selection"""
         files = []
-        
+        single = self.single_image_var.get()
+        multiple = self.multiple_images_var.get()
+        folder = self.folder_var.get()
+
         # Single image
-        if self.single_image_var.get():
-            files.append(self.single_image_var.get())
-        
+        if single:
+            files.append(single)
+
         # Multiple images
-        if self.multiple_images_var.get():
-            files.extend([f.strip() for f in self.multiple_images_var.get().split(";")])
-        
-        # Folder
-        if self.folder_var.get():
-            folder_path = self.folder_var.get()
-            for ext in ['*.jpg', '*.jpeg', '*.png', '*.bmp', '*.tiff', '*.tif']:
-                files.extend(Path(folder_path).glob(ext))
-            files = [str(f) for f in files]
-        
-        return list(set(files))  # Remove duplicates
+        if multiple:
+            files.extend(f.strip() for f in multiple.split(";"))
+
+        # Folder: one directory scan with an extension filter instead of one
+        # glob pass per extension
+        if folder:
+            try:
+                with os.scandir(folder) as it:
+                    files.extend(e.path for e in it
+                                 if e.is_file(follow_symlinks=False)
+                                 and os.path.splitext(e.name)[1].lower() in self._IMG_EXT_SET)
+            except OSError:
+                pass
+
+        # A lone non-folder source can't contain duplicates; skip the dedup
+        if sum(map(bool, (single, multiple, folder))) == 1 and not folder:
+            return files
+        return list(dict.fromkeys(files))  # Remove duplicates, keep order
     
     def get_language_config(self):
         """Get language configuration for OCR"""
@@ -510,65 +597,293 @@ Note: Bengali language support is required for Bengali text recognition."""
         # Clear results
         self.results_text.delete(1.0, tk.END)
         
-        # Start processing thread
-        thread = threading.Thread(target=self.process_images, args=(input_files,))
+        # Start the UI drain loop for this run
+        self.root.after(50, self._drain_ui)
+
+        # Start processing thread; snapshot the output folder here so the
+        # workers never read a Tk variable
+        thread = threading.Thread(target=self.process_images,
+                                  args=(input_files, self.output_var.get()))
         thread.daemon = True
         thread.start()
     
-    def process_images(self, input_files):
-        """Process images with OCR"""
+    def process_images(self, input_files, out_dir):
+        """Process images with OCR, writing text files into out_dir"""
         try:
             total_files = len(input_files)
             success_count = 0
             language_config = self.get_language_config()
             
-            self.root.after(0, lambda: self.progress_bar.config(maximum=total_files))
-            
-            for i, file_path in enumerate(input_files):
+            self.root.after(0, functools.partial(self.progress_bar.config, maximum=total_files))
+
+            # Pool of persistent APIs, one per worker, so each thread keeps a
+            # loaded model across images. tesserocr releases the GIL during
+            # recognition (and the pytesseract fallback waits on a subprocess),
+            # so OCR runs across cores while this thread drives the UI updates.
+            workers = max(1, (os.cpu_count() or 2) // 2)
+            api_pool = queue.Queue()
+            apis = []
+            if _get_tesserocr() is not None:
+                for _ in range(workers):
+                    api = self._create_ocr_api(language_config)
+                    if api is None:
+                        break
+                    apis.append(api)
+            if len(apis) == workers:
+                for api in apis:
+                    api_pool.put(api)
+            else:
+                # Couldn't build a full tesserocr pool; fall back to pytesseract.
+                # Those workers spend their time waiting on a separate tesseract
+                # process (each capped to one OpenMP thread), so the pool can
+                # span every core instead of half of them.
+                for api in apis:
+                    api.End()
+                apis = []
+                workers = max(1, os.cpu_count() or 1)
+                for _ in range(workers):
+                    api_pool.put(None)
+
+            done = 0
+
+            def report(file_path, ok, error=None):
+                # Queue one tuple per image for the UI drain loop instead of
+                # scheduling three Tcl callbacks here
+                nonlocal done, success_count
+                done += 1
+                name = os.path.basename(file_path)
+                if error is not None:
+                    line = f"✗ Error: {name} - {error}"
+                elif ok:
+                    success_count += 1
+                    line = f"✓ Success: {name}"
+                else:
+                    line = f"✗ Failed: {name}"
+                self._ui_queue.append((done, f"Processing: {name}", line))
+
+            def ocr_one(file_path):
+                api = api_pool.get()
                 try:
-                    # Update progress
-                    self.root.after(0, lambda f=file_path: self.progress_var.set(f"Processing: {os.path.basename(f)}"))
-                    self.root.after(0, lambda x=i+1: self.progress_bar.config(value=x))
-                    
-                    # Process image
-                    if self.process_single_image(file_path, language_config):
-                        success_count += 1
-                        self.root.after(0, lambda f=file_path: self.add_result(f"✓ Success: {os.path.basename(f)}"))
+                    return self.process_single_image(file_path, language_config, out_dir, api=api)
+                finally:
+                    api_pool.put(api)
+
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    if apis:
+                        futures = {pool.submit(ocr_one, f): f for f in input_files}
+                        for future in as_completed(futures):
+                            file_path = futures[future]
+                            try:
+                                report(file_path, future.result())
+                            except Exception as e:
+                                report(file_path, False, error=str(e))
                     else:
-                        self.root.after(0, lambda f=file_path: self.add_result(f"✗ Failed: {os.path.basename(f)}"))
-                    
-                except Exception as e:
-                    self.root.after(0, lambda f=file_path, e=str(e): self.add_result(f"✗ Error: {os.path.basename(f)} - {e}"))
-            
+                        # pytesseract path: amortize process startup by feeding
+                        # tesseract a list file per chunk instead of forking
+                        # once per image.
+                        chunks = [input_files[i:i + self._BATCH_CHUNK]
+                                  for i in range(0, total_files, self._BATCH_CHUNK)]
+                        futures = {pool.submit(self._ocr_batch_pytesseract, chunk, language_config, out_dir): chunk
+                                   for chunk in chunks}
+                        for future in as_completed(futures):
+                            try:
+                                for file_path, ok in future.result():
+                                    report(file_path, ok)
+                            except Exception as e:
+                                for file_path in futures[future]:
+                                    report(file_path, False, error=str(e))
+            finally:
+                for api in apis:
+                    api.End()
+
             # Processing complete
-            self.root.after(0, lambda: self.processing_complete(success_count, total_files))
+            self.root.after(0, functools.partial(self.processing_complete, success_count, total_files))
             
         except Exception as e:
-            self.root.after(0, lambda: self.processing_error(str(e)))
+            self.root.after(0, functools.partial(self.processing_error, str(e)))
     
-    def process_single_image(self, image_path, language_config):
+    def _create_ocr_api(self, language_config):
+        """Create a persistent tesserocr API for a batch, or None to use pytesseract."""
+        tesserocr = _get_tesserocr()
+        if tesserocr is None:
+            return None
+        try:
+            return tesserocr.PyTessBaseAPI(lang=language_config)
+        except Exception:
+            # e.g. tessdata not found by tesserocr; keep the pytesseract path
+            return None
+
+    def _ocr_batch_pytesseract(self, files, language_config, out_dir):
+        """OCR a chunk of files with one tesseract invocation via a list file.
+
+        Tesseract accepts a text file listing image paths and emits one
+        concatenated output with form-feed page separators, so a chunk pays
+        the binary's startup and model-load cost once instead of per image.
+        Returns a list of (file_path, ok) pairs.
+        """
+        results = []
+        pending = []
+        # Resolve cache hits first; only misses go to Tesseract
+        for file_path in files:
+            try:
+                with open(file_path, 'rb') as f:
+                    image_bytes = f.read()
+                key = hashlib.blake2b(image_bytes, digest_size=16).hexdigest() + '-' + language_config
+            except Exception:
+                results.append((file_path, False))
+                continue
+            text = self._read_cached_text(key)
+            if text is None:
+                pending.append((file_path, key))
+            else:
+                self._ocr_mem_cache[key] = text
+                results.append((file_path, self._write_output_text(file_path, text, out_dir)))
+        if not pending:
+            return results
+
+        tmpdir = tempfile.mkdtemp(prefix='ocr_batch_')
+        try:
+            list_path = os.path.join(tmpdir, 'images.txt')
+            with open(list_path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(p for p, _ in pending))
+            output_base = os.path.join(tmpdir, 'out')
+            import pytesseract
+            pytesseract.pytesseract.run_tesseract(
+                list_path, output_base, extension='txt', lang=language_config)
+            with open(output_base + '.txt', 'r', encoding='utf-8') as f:
+                pages = f.read().split('\x0c')
+            for (file_path, key), text in zip(pending, pages):
+                self._write_cached_text(key, text)
+                self._ocr_mem_cache[key] = text
+                results.append((file_path, self._write_output_text(file_path, text, out_dir)))
+            for file_path, _ in pending[len(pages):]:
+                results.append((file_path, False))
+        except Exception:
+            # One unreadable image fails the whole invocation; recover the
+            # rest of the chunk file by file.
+            done = {f for f, _ in results}
+            for file_path, _ in pending:
+                if file_path not in done:
+                    results.append((file_path, self.process_single_image(file_path, language_config, out_dir)))
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+        return results
+
+    def _write_output_text(self, image_path, text, out_dir):
+        """Write OCR text for image_path into out_dir."""
+        try:
+            base_name = os.path.splitext(os.path.basename(image_path))[0]
+            output_file = os.path.join(out_dir, f"{base_name}.txt")
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(text)
+            return True
+        except Exception as e:
+            print(f"Error writing output for {image_path}: {str(e)}")
+            return False
+
+    def _cache_path(self, key):
+        return os.path.join(self._ocr_cache_dir, key + '.txt')
+
+    def _read_cached_text(self, key):
+        """Return cached OCR text for key, or None on miss."""
+        text = self._ocr_mem_cache.get(key)
+        if text is not None:
+            return text
+        try:
+            with open(self._cache_path(key), 'r', encoding='utf-8') as f:
+                return f.read()
+        except Exception:
+            return None
+
+    def _write_cached_text(self, key, text):
+        """Persist OCR text for key; failures only cost future cache hits."""
+        try:
+            os.makedirs(self._ocr_cache_dir, exist_ok=True)
+            # Unique temp name so parallel workers never interleave writes
+            tmp = self._cache_path(key) + f'.tmp{threading.get_ident()}'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp, self._cache_path(key))
+        except Exception:
+            pass
+
+    def clear_ocr_cache(self):
+        """Drop all cached OCR results (in-memory and on-disk)."""
+        self._ocr_mem_cache.clear()
+        try:
+            if os.path.isdir(self._ocr_cache_dir):
+                for name in os.listdir(self._ocr_cache_dir):
+                    if name.endswith('.txt'):
+                        os.remove(os.path.join(self._ocr_cache_dir, name))
+        except Exception:
+            pass
+
+    def process_single_image(self, image_path, language_config, out_dir, api=None):
         """Process a single image with OCR"""
         try:
-            # Open image
-            image = Image.open(image_path)
-            
-            # Perform OCR
-            text = pytesseract.image_to_string(image, lang=language_config)
-            
+            # Hash the image bytes so identical files (re-runs, duplicate
+            # names across folders) skip OCR entirely.
+            with open(image_path, 'rb') as f:
+                image_bytes = f.read()
+            key = hashlib.blake2b(image_bytes, digest_size=16).hexdigest() + '-' + language_config
+
+            text = self._read_cached_text(key)
+            if text is None:
+                # Open image and drop to grayscale: Tesseract binarizes
+                # internally anyway, and a single-channel image is a third of
+                # the bytes handed over (or written to the temp PNG on the
+                # pytesseract path)
+                from PIL import Image
+                image = Image.open(io.BytesIO(image_bytes)).convert('L')
+
+                # Perform OCR
+                if api is not None:
+                    api.SetImage(image)
+                    text = api.GetUTF8Text()
+                else:
+                    import pytesseract
+                    text = pytesseract.image_to_string(image, lang=language_config)
+                self._write_cached_text(key, text)
+            self._ocr_mem_cache[key] = text
+
             # Create output filename
             base_name = os.path.splitext(os.path.basename(image_path))[0]
-            output_file = os.path.join(self.output_var.get(), f"{base_name}.txt")
-            
+            output_file = os.path.join(out_dir, f"{base_name}.txt")
+
             # Save text to file
             with open(output_file, 'w', encoding='utf-8') as f:
                 f.write(text)
-            
+
             return True
-            
+
         except Exception as e:
             print(f"Error processing {image_path}: {str(e)}")
             return False
     
+    def _drain_ui(self):
+        """Flush queued worker updates to the widgets in one batch.
+
+        Runs at most every 50 ms on the Tk thread: the progress bar and
+        status label get the newest value only, and all pending result lines
+        go into the text widget as a single insert.
+        """
+        progress = status = None
+        lines = []
+        for _ in range(len(self._ui_queue)):
+            progress, status, line = self._ui_queue.popleft()
+            if line:
+                lines.append(line)
+        if progress is not None:
+            self.progress_bar['value'] = progress
+        if status is not None:
+            self.progress_var.set(status)
+        if lines:
+            self.results_text.insert(tk.END, "\n".join(lines) + "\n")
+            self.results_text.see(tk.END)
+        if self.is_processing or self._ui_queue:
+            self.root.after(50, self._drain_ui)
+
     def add_result(self, message):
         """Add result message to results text area"""
         self.results_text.insert(tk.END, message + "\n")
@@ -620,6 +935,8 @@ Note: Bengali language support is required for Bengali text recognition."""
         ttk.Label(container, text="OCR Settings", style='Title.TLabel').grid(row=0, column=0, columnspan=3, pady=(0, 15), sticky=tk.W)
 
         # Tesseract Path Section
+        import pytesseract
+
         ttk.Label(container, text="Tesseract Executable:", style='Header.TLabel').grid(row=1, column=0, sticky=tk.W)
         tess_var = tk.StringVar(value=self.tesseract_path or pytesseract.pytesseract.tesseract_cmd)
         tess_entry = ttk.Entry(container, textvariable=tess_var, width=50)
@@ -662,6 +979,8 @@ Note: Bengali language support is required for Bengali text recognition."""
             if not self._test_tesseract_cmd(candidate):
                 if not messagebox.askyesno("Path Not Verified", "The selected path could not be verified. Save anyway?"):
                     return
+            # The saved binary may have been (re)installed; forget old probes
+            _probe_tesseract.cache_clear()
             self._set_tesseract_cmd(candidate, persist=True)
             self.tesseract_available = self._test_tesseract_cmd(candidate)
             status_var.set("Saved. Restart not required.")
@@ -686,8 +1005,17 @@ Note: Bengali language support is required for Bengali text recognition."""
             "Works without system PATH by configuring the Tesseract path."
         )).grid(row=6, column=0, columnspan=3, sticky=tk.W)
 
+        # OCR cache section
+        ttk.Label(container, text="OCR Cache", style='Header.TLabel').grid(row=7, column=0, pady=(20, 5), sticky=tk.W)
+
+        def clear_cache():
+            self.clear_ocr_cache()
+            status_var.set("OCR cache cleared.")
+
+        ttk.Button(container, text="Clear Cache", command=clear_cache).grid(row=8, column=0, sticky=tk.W)
+
         # Close button
-        ttk.Button(container, text="Close", command=settings_window.destroy).grid(row=7, column=0, pady=(20,0), sticky=tk.W)
+        ttk.Button(container, text="Close", command=settings_window.destroy).grid(row=9, column=0, pady=(20,0), sticky=tk.W)
 
     def show_tesseract_config_dialog(self):
         """Dedicated Tesseract configuration dialog, also accessible on startup."""
@@ -695,21 +1023,28 @@ Note: Bengali language support is required for Bengali text recognition."""
         self.show_settings()
     
     def load_settings(self):
-        """Load application settings"""
+        """Load application settings once; parsed values stay in _settings"""
+        self._settings = {}
         try:
             if os.path.exists('ocr_settings.json'):
                 with open('ocr_settings.json', 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                    if 'output_folder' in settings:
-                        self.output_var.set(settings['output_folder'])
-                    if 'tesseract_path' in settings and settings['tesseract_path']:
-                        self.tesseract_path = settings['tesseract_path']
-                        pytesseract.pytesseract.tesseract_cmd = self.tesseract_path
+                    self._settings = json.load(f) or {}
         except Exception:
-            pass
+            self._settings = {}
+        if self._settings.get('tesseract_path'):
+            import pytesseract
+            self.tesseract_path = self._settings['tesseract_path']
+            pytesseract.pytesseract.tesseract_cmd = self.tesseract_path
     
+    def _schedule_save(self):
+        """Debounce settings writes: at most one disk write per 500 ms burst."""
+        if self._pending_save is not None:
+            self.root.after_cancel(self._pending_save)
+        self._pending_save = self.root.after(500, self.save_settings)
+
     def save_settings(self):
         """Save application settings"""
+        self._pending_save = None
         try:
             settings = {}
             # Load existing to merge
@@ -723,8 +1058,14 @@ Note: Bengali language support is required for Bengali text recognition."""
             settings['output_folder'] = self.output_var.get()
             if self.tesseract_path:
                 settings['tesseract_path'] = self.tesseract_path
-            with open('ocr_settings.json', 'w', encoding='utf-8') as f:
-                json.dump(settings, f, ensure_ascii=False, indent=2)
+            blob = json.dumps(settings, ensure_ascii=False, indent=2)
+            if blob == self._last_saved_blob:
+                return
+            # Atomic replace so a crash mid-write can't leave torn settings
+            with open('ocr_settings.json.tmp', 'w', encoding='utf-8') as f:
+                f.write(blob)
+            os.replace('ocr_settings.json.tmp', 'ocr_settings.json')
+            self._last_saved_blob = blob
         except Exception:
             pass
 
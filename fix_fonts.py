@@ -20,42 +20,105 @@ Safety and Limitations
 - Control characters are sanitized from run text before processing.
 
 Dependencies
-- python-docx, regex, wordfreq, argparse, logging
+- python-docx, wordfreq, argparse, logging
 """
 
 from __future__ import annotations
 
 import argparse
+import io
 import logging
 import os
 import sys
+import threading
 import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from typing import List, Tuple
 from copy import deepcopy
 
-import regex as re
+import re
+from array import array
+from bisect import bisect_right
+from lxml import etree
 from docx import Document
+from docx.oxml import parse_xml
 from docx.text.paragraph import Paragraph
 from docx.text.run import Run
-try:
-    # Make wordfreq optional so GUI sentence mode can run without it
-    from wordfreq import zipf_frequency as _zipf_frequency
-except Exception:
-    _zipf_frequency = None
 from docx.oxml.shared import OxmlElement
 from docx.oxml.ns import qn
-try:
-    # GUI is optional; only used when --gui is provided
-    import tkinter as tk
-    from tkinter import filedialog, messagebox, scrolledtext
-except Exception:
-    tk = None  # Graceful fallback for environments without tkinter
+
+# wordfreq is optional (GUI sentence mode runs without it) and, like
+# tkinter, only needed on some paths, so both bind lazily on first use.
+_wordfreq = None
+
+
+def _get_zipf_frequency():
+    """Resolve wordfreq.zipf_frequency on first use; None when missing."""
+    global _wordfreq
+    if _wordfreq is None:
+        try:
+            import wordfreq
+        except Exception:
+            _wordfreq = False
+        else:
+            _wordfreq = wordfreq
+    return _wordfreq.zipf_frequency if _wordfreq else None
 
 
 # Compile tokenization patterns once
 EN_LIKE_WORD_RE = re.compile(r"[A-Za-z][A-Za-z'-]+")
-TOKEN_SPLIT_RE = re.compile(r"([A-Za-z][A-Za-z'-]+|\s+|[^A-Za-z\s]+)")
-CTRL_CHARS_RE = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]")
+# Tagged alternation: one scan yields both the chunk and its kind (w=English-
+# like word, s=whitespace, o=other) via lastgroup, replacing a findall pass
+# followed by a per-chunk fullmatch.
+TAGGED_TOKEN_RE = re.compile(r"(?P<w>[A-Za-z][A-Za-z'-]+)|(?P<s>\s+)|(?P<o>[^A-Za-z\s]+)")
+# Sentence boundary: capture through terminal .!? while guarding initials
+# and two-letter abbreviations (e.g. "Dr.", "U.S.") via fixed-width lookbehinds
+SENTENCE_SPLIT_RE = re.compile(r"(?<!\w\.[A-Za-z])(?<![A-Z][a-z]\.)\s*(.+?[.!?])(?:\s+|$)")
+# Deletion table for sanitize_text: C0 controls minus tab/LF/CR, plus DEL
+_CTRL_TABLE = dict.fromkeys(
+    [i for i in range(0x20) if i not in (0x09, 0x0A, 0x0D)] + [0x7F], None
+)
+
+# Cheap membership probe used to skip runs that cannot contain English tokens
+_HAS_LATIN = re.compile(r"[A-Za-z]").search
+
+# Clark-notation tags resolved once; qn() does a prefix lookup per call
+_QN_P = qn("w:p")
+_QN_RFONTS = qn("w:rFonts")
+_QN_ASCII = qn("w:ascii")
+_QN_HANSI = qn("w:hAnsi")
+_QN_ASCII_THEME = qn("w:asciiTheme")
+_QN_HANSI_THEME = qn("w:hAnsiTheme")
+
+
+@lru_cache(maxsize=8)
+def _english_word_set(threshold: float) -> frozenset:
+    """All English words with zipf frequency >= threshold, built once.
+
+    The threshold is fixed for the duration of a conversion, so the per-
+    token zipf_frequency call (dict lookup plus log math inside wordfreq)
+    collapses to a single frozenset membership test. wordfreq's wordlist
+    iterates in decreasing frequency order, so the scan stops at the first
+    word that falls below the threshold.
+    """
+    from wordfreq import iter_wordlist
+
+    zipf_frequency = _get_zipf_frequency()
+    words = []
+    append = words.append
+    for word in iter_wordlist("en"):
+        if zipf_frequency(word, "en") < threshold:
+            break
+        append(word)
+    return frozenset(words)
+
+
+@lru_cache(maxsize=None)
+def _zipf_cached(lower_token: str) -> float:
+    """Cached zipf_frequency for tokens the wordlist cannot represent."""
+    return _get_zipf_frequency()(lower_token, "en")
 
 
 def is_english_word(token: str, threshold: float) -> bool:
@@ -67,65 +130,87 @@ def is_english_word(token: str, threshold: float) -> bool:
     """
     if not token:
         return False
-    cleaned = re.sub(r"[^A-Za-z'-]", "", token)
+    cleaned = _clean_token(token)
     if len(cleaned) < 2:
         return False
-    if _zipf_frequency is None:
+    if _get_zipf_frequency() is None:
         # Signal that English detection is unavailable (handled by CLI gate)
         raise RuntimeError("wordfreq not installed; English detection unavailable.")
-    freq = _zipf_frequency(cleaned.lower(), "en")
-    return freq >= threshold
+    lowered = cleaned.lower()
+    if "-" in lowered:
+        # Hyphenated compounds ("well-known") are not wordlist entries;
+        # zipf_frequency combines their token frequencies, so keep the
+        # per-call path for them. lru_cached, so each compound pays once.
+        return _zipf_cached(lowered) >= threshold
+    if lowered in _english_word_set(threshold):
+        return True
+    if "'" in lowered:
+        # Possessives ("teachers'") also miss the wordlist; zipf_frequency
+        # tokenizes them down to the base word, so fall back the same way.
+        return _zipf_cached(lowered) >= threshold
+    return False
 
 
-def _clean_token(token: str) -> str:
-    return re.sub(r"[^A-Za-z'-]", "", token) if token else ""
+class _TokenCleanTable(dict):
+    """str.translate table deleting everything outside [A-Za-z'-].
 
+    Entries are materialized lazily per codepoint, so the table stays tiny
+    (only characters actually seen) while translate runs as a single C-level
+    pass with no regex machinery.
+    """
 
-def should_use_tnr(token: str, threshold: float, src_font_name: str | None) -> bool:
-    """Decide whether to set Times New Roman for this token.
+    def __missing__(self, cp: int):
+        ch = chr(cp)
+        keep = cp if ("A" <= ch <= "Z" or "a" <= ch <= "z" or ch in "'-") else None
+        self[cp] = keep
+        return keep
 
-    Heuristic to avoid false positives for Bijoy-encoded Bangla:
-    - Use is_english_word() as primary signal.
-    - If the source run is explicitly SutonnyMJ and the cleaned token length <= 3,
-      do NOT convert to TNR even if frequency passes threshold. This prevents
-      converting short Bijoy syllables like "am", "to", "in", etc.
-    - For length >= 4, follow is_english_word() result.
-    """
-    cleaned = _clean_token(token)
+
+_TOKEN_CLEAN_TABLE = _TokenCleanTable()
+
+
+def _clean_token(token: str) -> str:
+    return token.translate(_TOKEN_CLEAN_TABLE) if token else ""
+
+
+@lru_cache(maxsize=None)
+def _should_use_tnr_cached(cleaned: str, threshold: float, is_sutonny: bool) -> bool:
+    """Cached decision core of should_use_tnr, keyed on the cleaned token."""
     if len(cleaned) < 2:
         return False
 
     if not is_english_word(cleaned, threshold):
         return False
 
-    font_name = (src_font_name or "").lower()
-    if "sutonny" in font_name and len(cleaned) <= 3:
+    if is_sutonny and len(cleaned) <= 3:
         return False
 
     return True
 
 
-def split_into_chunks(text: str) -> List[str]:
-    """Split text into chunks preserving order and token types.
+def should_use_tnr(token: str, threshold: float, is_sutonny: bool) -> bool:
+    """Decide whether to set Times New Roman for this token.
 
-    Chunks follow this precedence order:
-    - English-like word: [A-Za-z][A-Za-z'-]+
-    - Whitespace: \\s+
-    - Anything else: [^A-Za-z\s]+
+    Heuristic to avoid false positives for Bijoy-encoded Bangla:
+    - Use is_english_word() as primary signal.
+    - If the source run is explicitly SutonnyMJ and the cleaned token length <= 3,
+      do NOT convert to TNR even if frequency passes threshold. This prevents
+      converting short Bijoy syllables like "am", "to", "in", etc.
+    - For length >= 4, follow is_english_word() result.
 
-    Returns a list of non-empty chunks.
+    The only caller passes chunks matching EN_LIKE_WORD_RE, which are clean
+    by construction, so no cleaning pass is needed here. The caller also
+    resolves the run's font name to the is_sutonny bool once per run, since
+    the name is constant across chunks.
     """
-    if not text:
-        return []
-    parts = TOKEN_SPLIT_RE.findall(text)
-    return [p for p in parts if p]
+    return _should_use_tnr_cached(token, threshold, is_sutonny)
 
 
 def sanitize_text(text: str) -> str:
     """Remove non-ASCII control characters except standard whitespace."""
     if not text:
         return ""
-    return CTRL_CHARS_RE.sub("", text)
+    return text.translate(_CTRL_TABLE)
 
 
 def clone_run_style(src_run: Run, dst_run: Run) -> None:
@@ -181,7 +266,9 @@ def copy_rFonts(src_run: Run, dst_run: Run) -> None:
         if getattr(d_rPr, "rFonts", None) is not None:
             d_rPr.remove(d_rPr.rFonts)
 
-        cloned = deepcopy(src_rFonts)
+        # rFonts is an attribute-only leaf, so copying attrib beats deepcopy
+        cloned = OxmlElement("w:rFonts")
+        cloned.attrib.update(src_rFonts.attrib)
         d_rPr.append(cloned)
     except Exception:
         # Be fail-safe; if copy fails, silently continue
@@ -197,14 +284,12 @@ def set_ascii_hAnsi(run: Run, font_name: str) -> None:
             rFonts = OxmlElement("w:rFonts")
             rPr.append(rFonts)
 
-        rFonts.set(qn("w:ascii"), font_name)
-        rFonts.set(qn("w:hAnsi"), font_name)
+        rFonts.set(_QN_ASCII, font_name)
+        rFonts.set(_QN_HANSI, font_name)
 
         # Avoid theme overrides that may conflict
-        if rFonts.get(qn("w:asciiTheme")) is not None:
-            rFonts.attrib.pop(qn("w:asciiTheme"), None)
-        if rFonts.get(qn("w:hAnsiTheme")) is not None:
-            rFonts.attrib.pop(qn("w:hAnsiTheme"), None)
+        rFonts.attrib.pop(_QN_ASCII_THEME, None)
+        rFonts.attrib.pop(_QN_HANSI_THEME, None)
     except Exception:
         pass
 
@@ -221,21 +306,23 @@ def _is_run_in_hyperlink(run: Run) -> bool:
         return False
 
 
+# Field-code tags checked per run; resolved once instead of via per-run XPath
+_FIELD_TAGS = {qn("w:fldChar"), qn("w:instrText")}
+_FLD_SIMPLE_TAG = qn("w:fldSimple")
+
+
 def _is_run_field_code(run: Run) -> bool:
     """Detect field code runs (fldChar/instrText/fldSimple) and skip them."""
     r = run._r
     try:
         # Any fldChar or instrText descendants
-        if r.xpath(".//w:fldChar", namespaces={"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}):
-            return True
-        if r.xpath(".//w:instrText", namespaces={"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}):
-            return True
+        for child in r.iter():
+            if child.tag in _FIELD_TAGS:
+                return True
         # Parent fldSimple
         parent = r.getparent()
-        if parent is not None:
-            tag = getattr(parent, "tag", "")
-            if tag.endswith("}fldSimple"):
-                return True
+        if parent is not None and getattr(parent, "tag", "") == _FLD_SIMPLE_TAG:
+            return True
     except Exception:
         return False
     return False
@@ -244,15 +331,19 @@ def _is_run_field_code(run: Run) -> bool:
 def _insert_run_after(paragraph: Paragraph, anchor_r) -> Run:
     """Create a new run and insert it immediately after anchor_r in the XML tree.
 
+    Builds the w:r element directly instead of paragraph.add_run("") plus a
+    reposition: add_run appends at the end of the paragraph, which walks the
+    child list every call and made splitting a K-run paragraph quadratic.
+
     Returns the new Run object.
     """
-    new_run = paragraph.add_run("")  # creates at end, will reposition
+    r_el = OxmlElement("w:r")
     try:
-        anchor_r.addnext(new_run._r)
+        anchor_r.addnext(r_el)
     except Exception:
-        # Fallback: leave at end if reposition fails
-        pass
-    return new_run
+        # Fallback: leave at end if insertion after the anchor fails
+        paragraph._p.append(r_el)
+    return Run(r_el, paragraph)
 
 
 def process_run(paragraph: Paragraph, run: Run, threshold: float) -> Tuple[int, int]:
@@ -272,33 +363,69 @@ def process_run(paragraph: Paragraph, run: Run, threshold: float) -> Tuple[int,
         logging.debug("Skipping field code run: %r", text)
         return (1, 0)
 
-    chunks = split_into_chunks(text)
-    if not chunks:
+    # No Latin letter means no chunk can ever become TNR; splitting would
+    # only churn the XML into an identical result. Sanitization must still
+    # land, so write the cleaned text back if it differs.
+    if not _HAS_LATIN(text):
+        if run.text != text:
+            run.text = text
         return (1, 0)
 
-    english_changed = 0
-    anchor = run._r
-
-    src_font_name = None
     try:
-        src_font_name = (run.font.name or "")
+        src_font_name = run.font.name or ""
     except Exception:
-        src_font_name = None
+        src_font_name = ""
+    font_is_sutonny = bool(src_font_name) and "sutonny" in src_font_name.lower()
+
+    # Whole run is a single English-like word: decide TNR on the original
+    # run in place, skipping the split-and-recreate work entirely.
+    if EN_LIKE_WORD_RE.fullmatch(text):
+        if run.text != text:
+            run.text = text
+        if should_use_tnr(text, threshold, font_is_sutonny):
+            try:
+                set_ascii_hAnsi(run, "Times New Roman")
+                logging.debug("Whole run ascii/hAnsi -> Times New Roman: %r", text)
+                return (1, 1)
+            except Exception as e:
+                logging.debug("Failed to adjust rFonts for run %r: %s", text, e)
+        return (1, 0)
+
+    matches = list(TAGGED_TOKEN_RE.finditer(text))
+    if not matches:
+        return (1, 0)
 
-    for chunk in chunks:
-        is_en_like = bool(EN_LIKE_WORD_RE.fullmatch(chunk))
-        make_tnr = is_en_like and should_use_tnr(chunk, threshold, src_font_name)
+    english_changed = 0
+    anchor = run._r
+    # Each logging.debug call pays formatting-and-lock dispatch even when
+    # DEBUG is off; decide once per run instead of once per chunk.
+    debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+
+    # Copy the source formatting once: the whole rPr element carries every
+    # property clone_run_style used to re-read per chunk (bold, size, color,
+    # rStyle, rFonts, ...), so each chunk only deep-copies this small
+    # template instead of walking the docx font descriptors again.
+    src_rPr = getattr(run._r, "rPr", None)
+    template_rPr = deepcopy(src_rPr) if src_rPr is not None else None
+
+    for m in matches:
+        chunk = m.group()
+        is_en_like = m.lastgroup == "w"
+        make_tnr = is_en_like and should_use_tnr(chunk, threshold, font_is_sutonny)
 
         new_run = _insert_run_after(paragraph, anchor)
         new_run.text = chunk
-        clone_run_style(run, new_run)
+        if template_rPr is not None:
+            # rPr must precede the w:t created by the text assignment
+            new_run._r.insert(0, deepcopy(template_rPr))
 
         try:
             if make_tnr:
                 set_ascii_hAnsi(new_run, "Times New Roman")
                 english_changed += 1
-                logging.debug("Chunk ascii/hAnsi -> Times New Roman: %r", chunk)
-            else:
+                if debug:
+                    logging.debug("Chunk ascii/hAnsi -> Times New Roman: %r", chunk)
+            elif debug:
                 # Preserve original rFonts (already copied in clone_run_style)
                 logging.debug("Chunk preserves original rFonts: %r", chunk)
         except Exception as e:
@@ -331,67 +458,101 @@ def process_paragraph(paragraph: Paragraph, threshold: float) -> Tuple[int, int]
     return runs_scanned, english_changed
 
 
-def process_table(table, threshold: float) -> Tuple[int, int, int]:
-    """Process all paragraphs in a table (recursively includes nested tables).
-
-    Returns: (paragraphs_processed, runs_scanned, english_tokens_changed)
-    """
-    paragraphs = 0
-    runs_scanned = 0
-    english_changed = 0
-
+def _iter_table_paragraphs(table):
+    """Yield all paragraphs in a table, recursing into nested tables."""
     for row in table.rows:
         for cell in row.cells:
-            for p in cell.paragraphs:
-                paragraphs += 1
-                r_scanned, en_changed = process_paragraph(p, threshold)
-                runs_scanned += r_scanned
-                english_changed += en_changed
+            yield from cell.paragraphs
             for nested in cell.tables:
-                p2, r2, e2 = process_table(nested, threshold)
-                paragraphs += p2
-                runs_scanned += r2
-                english_changed += e2
+                yield from _iter_table_paragraphs(nested)
 
-    return paragraphs, runs_scanned, english_changed
 
+def iter_body_paragraphs(doc: Document):
+    """Yield body paragraphs followed by paragraphs in body tables."""
+    yield from doc.paragraphs
+    for t in doc.tables:
+        yield from _iter_table_paragraphs(t)
 
-def process_headers_footers(doc: Document, threshold: float) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
-    """Process headers and footers of all sections.
-
-    Returns ((hdr_paras, hdr_runs, hdr_english), (ftr_paras, ftr_runs, ftr_english))
-    """
-    hdr_paras = hdr_runs = hdr_en = 0
-    ftr_paras = ftr_runs = ftr_en = 0
 
+def iter_header_paragraphs(doc: Document):
+    """Yield paragraphs of every section header, including header tables."""
     for section in doc.sections:
         header = section.header
         if header is not None:
-            for p in header.paragraphs:
-                hdr_paras += 1
-                r, e = process_paragraph(p, threshold)
-                hdr_runs += r
-                hdr_en += e
+            yield from header.paragraphs
             for t in header.tables:
-                p2, r2, e2 = process_table(t, threshold)
-                hdr_paras += p2
-                hdr_runs += r2
-                hdr_en += e2
+                yield from _iter_table_paragraphs(t)
+
 
+def iter_footer_paragraphs(doc: Document):
+    """Yield paragraphs of every section footer, including footer tables."""
+    for section in doc.sections:
         footer = section.footer
         if footer is not None:
-            for p in footer.paragraphs:
-                ftr_paras += 1
-                r, e = process_paragraph(p, threshold)
-                ftr_runs += r
-                ftr_en += e
+            yield from footer.paragraphs
             for t in footer.tables:
-                p2, r2, e2 = process_table(t, threshold)
-                ftr_paras += p2
-                ftr_runs += r2
-                ftr_en += e2
+                yield from _iter_table_paragraphs(t)
+
+
+def iter_all_paragraphs(doc: Document):
+    """Yield every paragraph in the document: body, tables, headers, footers."""
+    yield from iter_body_paragraphs(doc)
+    yield from iter_header_paragraphs(doc)
+    yield from iter_footer_paragraphs(doc)
+
+
+# Paragraph counts below this aren't worth the process-pool startup and IPC
+_PARALLEL_MIN_PARAS = 500
 
-    return (hdr_paras, hdr_runs, hdr_en), (ftr_paras, ftr_runs, ftr_en)
+
+def _process_paragraph_xml(threshold: float, xml: bytes) -> Tuple[bytes, int, int]:
+    """Worker: process one serialized paragraph, return mutated XML + counts."""
+    p_el = parse_xml(xml)
+    runs, english = process_paragraph(Paragraph(p_el, None), threshold)
+    return etree.tostring(p_el), runs, english
+
+
+def _process_paragraphs_parallel(paragraphs: List[Paragraph], threshold: float) -> Tuple[int, int] | None:
+    """Process paragraphs across a process pool; returns (runs, english).
+
+    Each paragraph's XML is serialized to a worker, mutated there, and the
+    returned element swapped back into the tree — paragraph processing is
+    independent per paragraph, so this scales with cores for large
+    documents. Returns None when the pool isn't worthwhile or fails, in
+    which case the caller processes serially.
+    """
+    workers = os.cpu_count() or 1
+    if workers < 2:
+        return None
+    try:
+        xmls = [etree.tostring(p._p) for p in paragraphs]
+        chunksize = max(1, len(xmls) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(partial(_process_paragraph_xml, threshold),
+                                    xmls, chunksize=chunksize))
+        runs = english = 0
+        for p, (new_xml, r, e) in zip(paragraphs, results):
+            new_el = parse_xml(new_xml)
+            p._p.getparent().replace(p._p, new_el)
+            p._p = new_el
+            runs += r
+            english += e
+        return runs, english
+    except Exception as e:
+        logging.warning("Parallel paragraph processing failed (%s); falling back to serial.", e)
+        return None
+
+
+def _resolve_out_path(in_path: str, out_path: str | None) -> str:
+    """Pick the output path, never allowing it to overwrite the input."""
+    if not out_path:
+        base, ext = os.path.splitext(in_path)
+        out_path = f"{base}_fixed{ext or '.docx'}"
+    if os.path.abspath(out_path) == os.path.abspath(in_path):
+        base, ext = os.path.splitext(in_path)
+        out_path = f"{base}_fixed{ext or '.docx'}"
+        logging.warning("Output path same as input; writing to %s", out_path)
+    return out_path
 
 
 def convert_docx(in_path: str, out_path: str | None, threshold: float, dry_run: bool) -> None:
@@ -407,26 +568,25 @@ def convert_docx(in_path: str, out_path: str | None, threshold: float, dry_run:
         logging.error("Failed to open DOCX: %s", e)
         raise
 
-    total_paras = 0
-    total_runs = 0
-    total_english_tokens = 0
-
-    # Body paragraphs
-    for p in doc.paragraphs:
-        total_paras += 1
-        r_scanned, en_changed = process_paragraph(p, threshold)
-        total_runs += r_scanned
-        total_english_tokens += en_changed
-
-    # Tables in body
-    for t in doc.tables:
-        p2, r2, e2 = process_table(t, threshold)
-        total_paras += p2
-        total_runs += r2
-        total_english_tokens += e2
-
-    # Headers and footers
-    (hdr_p, hdr_r, hdr_e), (ftr_p, ftr_r, ftr_e) = process_headers_footers(doc, threshold)
+    def process_group(paragraphs) -> Tuple[int, int, int]:
+        plist = list(paragraphs)
+        if len(plist) >= _PARALLEL_MIN_PARAS:
+            result = _process_paragraphs_parallel(plist, threshold)
+            if result is not None:
+                runs, english = result
+                return len(plist), runs, english
+        paras = runs = english = 0
+        for p in plist:
+            paras += 1
+            r_scanned, en_changed = process_paragraph(p, threshold)
+            runs += r_scanned
+            english += en_changed
+        return paras, runs, english
+
+    # One flattened pass per document part
+    total_paras, total_runs, total_english_tokens = process_group(iter_body_paragraphs(doc))
+    hdr_p, hdr_r, hdr_e = process_group(iter_header_paragraphs(doc))
+    ftr_p, ftr_r, ftr_e = process_group(iter_footer_paragraphs(doc))
 
     # Log per-section counts for dry-run insight
     logging.info("Main body: paragraphs=%d, runs=%d, english_tokens=%d", total_paras, total_runs, total_english_tokens)
@@ -444,16 +604,7 @@ def convert_docx(in_path: str, out_path: str | None, threshold: float, dry_run:
                      grand_paras, grand_runs, grand_english, elapsed)
         return
 
-    # Determine output path
-    if not out_path:
-        base, ext = os.path.splitext(in_path)
-        out_path = f"{base}_fixed{ext or '.docx'}"
-
-    # Safety: never overwrite input
-    if os.path.abspath(out_path) == os.path.abspath(in_path):
-        base, ext = os.path.splitext(in_path)
-        out_path = f"{base}_fixed{ext or '.docx'}"
-        logging.warning("Output path same as input; writing to %s", out_path)
+    out_path = _resolve_out_path(in_path, out_path)
 
     try:
         doc.save(out_path)
@@ -467,47 +618,164 @@ def convert_docx(in_path: str, out_path: str | None, threshold: float, dry_run:
     )
 
 
+def _convert_part_xml(xml: bytes, threshold: float) -> Tuple[bytes, int, int, int]:
+    """Process every w:p in one XML part; returns (xml, paras, runs, english)."""
+    root = parse_xml(xml)
+    paras = runs = english = 0
+    for p_el in root.iter(_QN_P):
+        paras += 1
+        r, e = process_paragraph(Paragraph(p_el, None), threshold)
+        runs += r
+        english += e
+    out = etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+    return out, paras, runs, english
+
+
+def convert_docx_fast(in_path: str, out_path: str | None, threshold: float, dry_run: bool) -> None:
+    """Convert without loading the document through python-docx.
+
+    Opens the DOCX as a zip, rewrites word/document.xml and every header and
+    footer part by walking their w:p elements directly, and streams all
+    other entries through untouched. Skipping python-docx's package, part
+    and relationship layers cuts peak memory and open time on large files;
+    run-level behavior is identical because the same process_paragraph
+    operates on the parsed elements. One w:p pass also reaches paragraphs
+    python-docx does not expose, such as text inside drawing text boxes.
+    """
+    start = time.time()
+
+    if not os.path.isfile(in_path):
+        logging.error("Input file not found: %s", in_path)
+        raise FileNotFoundError(f"Input file not found: {in_path}")
+
+    total_paras = total_runs = total_english = 0
+
+    def is_target(name: str) -> bool:
+        if name == "word/document.xml":
+            return True
+        return (name.startswith("word/header") or name.startswith("word/footer")) and name.endswith(".xml")
+
+    out_path = _resolve_out_path(in_path, out_path)
+
+    with zipfile.ZipFile(in_path) as zin:
+        if dry_run:
+            for item in zin.infolist():
+                if is_target(item.filename):
+                    _, p, r, e = _convert_part_xml(zin.read(item.filename), threshold)
+                    total_paras += p
+                    total_runs += r
+                    total_english += e
+            logging.info("Dry-run (fast): no file written. Total paragraphs=%d, runs=%d, english tokens changed=%d, elapsed=%.2fs",
+                         total_paras, total_runs, total_english, time.time() - start)
+            return
+
+        with zipfile.ZipFile(out_path, "w", zipfile.ZIP_DEFLATED) as zout:
+            for item in zin.infolist():
+                data = zin.read(item.filename)
+                if is_target(item.filename):
+                    data, p, r, e = _convert_part_xml(data, threshold)
+                    total_paras += p
+                    total_runs += r
+                    total_english += e
+                zout.writestr(item, data)
+
+    logging.info(
+        "Wrote: %s | Total paragraphs=%d, runs=%d, english tokens changed=%d, elapsed=%.2fs (fast mode)",
+        out_path, total_paras, total_runs, total_english, time.time() - start,
+    )
+
+
 # =========================
 # Sentence-based processing
 # =========================
 
-SENTENCE_SPLIT_RE = re.compile(r"(?<!\w\.[A-Za-z])(?<![A-Z][a-z]\.)\s*(.+?[.!?])(?:\s+|$)")
+@lru_cache(maxsize=4096)
+def _compile_literal(sentence: str):
+    """Compiled exact-match pattern for a sentence, shared across paragraphs."""
+    return re.compile(re.escape(sentence))
 
 
-def extract_sentences(text: str) -> List[str]:
-    """Extract complete sentences (ending with .!?) from input text.
+def _iter_file_sentences(path: str):
+    """Stream sentences out of a text file without reading it whole.
 
-    Returns list of trimmed sentences including their terminal punctuation.
+    Only an unmatched tail stays buffered: complete sentences are drained
+    as lines arrive, and a match that runs up to the buffer end is held
+    back until more text (or end of file) confirms the sentence really
+    stopped there. Peak memory is one line plus the pending tail instead
+    of the whole file.
     """
-    if not text:
-        return []
-    sentences = [m.group(1).strip() for m in SENTENCE_SPLIT_RE.finditer(text)]
-    # Deduplicate while preserving order
+    buf = ""
+    with open(path, "r", encoding="utf-8", buffering=1 << 20) as fh:
+        for line in fh:
+            buf += line
+            pos = 0
+            for m in SENTENCE_SPLIT_RE.finditer(buf):
+                if m.end() == len(buf):
+                    break
+                s = m.group(1).strip()
+                if s:
+                    yield s
+                pos = m.end()
+            if pos:
+                buf = buf[pos:]
+    for m in SENTENCE_SPLIT_RE.finditer(buf):
+        s = m.group(1).strip()
+        if s:
+            yield s
+
+
+def _gen_sentences(text: str):
+    """Yield trimmed, order-deduplicated sentences from input text."""
     seen = set()
-    ordered: List[str] = []
-    for s in sentences:
+    seen_add = seen.add
+    # One-item-per-line input with no terminators anywhere skips the regex
+    # scan entirely; three C-level membership probes decide the branch.
+    if "\n" in text and "." not in text and "!" not in text and "?" not in text:
+        for line in text.splitlines():
+            s = line.strip()
+            if s and s not in seen:
+                seen_add(s)
+                yield s
+        return
+    for m in SENTENCE_SPLIT_RE.finditer(text):
+        s = m.group(1).strip()
         if s and s not in seen:
-            ordered.append(s)
-            seen.add(s)
-    return ordered
+            seen_add(s)
+            yield s
+
+
+@lru_cache(maxsize=128)
+def extract_sentences(text: str) -> Tuple[str, ...]:
+    """Extract complete sentences (ending with .!?) from input text.
+
+    Sentences are trimmed, keep their terminal punctuation, and are
+    deduplicated preserving order. Returns an immutable tuple so the
+    result can be memoized: repeated GUI clicks or CLI loops over the
+    same text hit the cache instead of rescanning.
+    """
+    return tuple(_gen_sentences(text or ""))
 
 
-def build_paragraph_text_map(paragraph: Paragraph) -> Tuple[str, List[Tuple[Run, int, int]]]:
-    """Return (full_text, mapping) for a paragraph.
+def build_paragraph_text_map(paragraph: Paragraph):
+    """Return (full_text, runs, starts, ends) for a paragraph.
 
-    mapping is a list of tuples: (run_object, start_index_in_full_text, end_index).
+    runs[i] covers full_text[starts[i]:ends[i]]. The offsets live in two
+    contiguous int arrays rather than per-run tuples, and since ends is
+    sorted the first run overlapping a match can be found by bisection.
     """
     full = []
-    mapping: List[Tuple[Run, int, int]] = []
+    runs: List[Run] = []
+    starts = array("i")
+    ends = array("i")
     cursor = 0
     for r in paragraph.runs:
         t = r.text or ""
         full.append(t)
-        start = cursor
-        end = cursor + len(t)
-        mapping.append((r, start, end))
-        cursor = end
-    return ("".join(full), mapping)
+        runs.append(r)
+        starts.append(cursor)
+        cursor += len(t)
+        ends.append(cursor)
+    return ("".join(full), runs, starts, ends)
 
 
 def split_run_apply_tnr(paragraph: Paragraph, run: Run, local_start: int, local_end: int) -> None:
@@ -562,37 +830,89 @@ def apply_sentence_to_paragraph(paragraph: Paragraph, sentence: str) -> int:
     """
     if not sentence:
         return 0
+    # Escape for literal match; we want exact sentence matches. The compiled
+    # pattern is cached, so repeat sentences cost nothing across paragraphs.
+    return apply_pattern_to_paragraph(paragraph, _compile_literal(sentence))
 
-    converted = 0
-    search_from = 0
 
-    while True:
-        full_text, mapping = build_paragraph_text_map(paragraph)
-        if not full_text or search_from >= len(full_text):
-            break
+def combine_sentence_patterns(sentences: List[str]):
+    """Compile one alternation matching any of the sentences.
 
-        # Escape for literal match; we want exact sentence matches
-        pattern = re.compile(re.escape(sentence))
-        m = pattern.search(full_text, pos=search_from)
-        if not m:
-            break
+    Used as a paragraph prefilter: a single scan decides whether any
+    sentence occurs at all. Conversion itself stays per-sentence, because
+    one alternation pass cannot reproduce the spans that sequential
+    per-sentence passes convert when sentences overlap mid-match (e.g.
+    "foo bar" and "bar baz" in "foo bar baz"). Returns None for an
+    empty list.
+    """
+    ordered = [s for s in sentences if s]
+    if not ordered:
+        return None
+    return re.compile("|".join(re.escape(s) for s in ordered))
+
+
+def apply_pattern_to_paragraph(paragraph: Paragraph, pattern) -> int:
+    """Convert every match of an already-compiled pattern in this paragraph.
+
+    Returns the number of matches converted.
+    """
+    full_text, runs, starts, ends = build_paragraph_text_map(paragraph)
+    if not full_text:
+        return 0
 
-        g_start, g_end = m.span()
+    # One finditer pass finds every occurrence up front instead of rescanning
+    # the rebuilt paragraph text after each match.
+    spans = [m.span() for m in pattern.finditer(full_text)]
+    if not spans:
+        return 0
 
-        # Apply to all overlapping runs
-        for run, r_start, r_end in mapping:
+    # Splitting preserves the paragraph's character content, so span indices
+    # stay valid afterwards; only run boundaries move. Apply spans in reverse
+    # and refresh the run map between them so a sentence occurring twice
+    # inside one run is still handled.
+    for i, (g_start, g_end) in enumerate(reversed(spans)):
+        if i:
+            _, runs, starts, ends = build_paragraph_text_map(paragraph)
+        # First run whose end extends past the match start, then walk
+        # forward only while runs still begin inside the match.
+        idx = bisect_right(ends, g_start)
+        n = len(runs)
+        while idx < n and starts[idx] < g_end:
+            r_start = starts[idx]
             overlap_start = max(g_start, r_start)
-            overlap_end = min(g_end, r_end)
+            overlap_end = min(g_end, ends[idx])
             if overlap_start < overlap_end:
-                local_start = overlap_start - r_start
-                local_end = overlap_end - r_start
-                split_run_apply_tnr(paragraph, run, local_start, local_end)
+                split_run_apply_tnr(paragraph, runs[idx], overlap_start - r_start, overlap_end - r_start)
+            idx += 1
+
+    return len(spans)
+
 
-        converted += 1
-        # Move search_from past this match in the updated paragraph
-        search_from = g_end
+# Raw DOCX bytes keyed by (path, mtime_ns, size); the GUI workflow opens
+# the same input repeatedly while iterating on the sentence list, and this
+# skips the disk read on every click after the first. Small and bounded:
+# entries are whole-file bytes, so keep only a handful.
+_DOCX_BYTES_CACHE: dict = {}
+_DOCX_BYTES_CACHE_MAX = 4
 
-    return converted
+
+def _load_document(path: str) -> Document:
+    """Parse a DOCX, reusing cached file bytes for unchanged inputs.
+
+    A fresh Document is parsed per call because conversion mutates the
+    tree; only the zip bytes are shared. An edited file changes its
+    mtime/size key and is re-read.
+    """
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    data = _DOCX_BYTES_CACHE.get(key)
+    if data is None:
+        with open(path, "rb") as fh:
+            data = fh.read()
+        while len(_DOCX_BYTES_CACHE) >= _DOCX_BYTES_CACHE_MAX:
+            _DOCX_BYTES_CACHE.pop(next(iter(_DOCX_BYTES_CACHE)))
+        _DOCX_BYTES_CACHE[key] = data
+    return Document(io.BytesIO(data))
 
 
 def apply_sentences_docx(in_path: str, out_path: str | None, sentences: List[str]) -> Tuple[str, int]:
@@ -603,45 +923,22 @@ def apply_sentences_docx(in_path: str, out_path: str | None, sentences: List[str
     if not os.path.isfile(in_path):
         raise FileNotFoundError(f"Input file not found: {in_path}")
 
-    doc = Document(in_path)
+    doc = _load_document(in_path)
     total_converted = 0
 
-    # Helper to process all paragraphs recursively
-    def process_paragraphs(paragraphs: List[Paragraph]) -> None:
-        nonlocal total_converted
-        for p in paragraphs:
+    # The combined alternation filters paragraphs in one scan; only those
+    # with at least one hit pay the per-sentence passes, which keep the
+    # exact conversion semantics for overlapping sentences. The quadratic
+    # cost survives only on paragraphs that actually contain a match.
+    pattern = combine_sentence_patterns(sentences)
+    if pattern is not None:
+        search = pattern.search
+        for p in iter_all_paragraphs(doc):
+            if not search(p.text):
+                continue
             for s in sentences:
                 total_converted += apply_sentence_to_paragraph(p, s)
 
-    # Body
-    process_paragraphs(doc.paragraphs)
-    # Tables in body
-    for t in doc.tables:
-        for row in t.rows:
-            for cell in row.cells:
-                process_paragraphs(cell.paragraphs)
-                for nt in cell.tables:
-                    for nrow in nt.rows:
-                        for ncell in nrow.cells:
-                            process_paragraphs(ncell.paragraphs)
-
-    # Headers/Footers
-    for section in doc.sections:
-        hdr = section.header
-        if hdr is not None:
-            process_paragraphs(hdr.paragraphs)
-            for t in hdr.tables:
-                for row in t.rows:
-                    for cell in row.cells:
-                        process_paragraphs(cell.paragraphs)
-        ftr = section.footer
-        if ftr is not None:
-            process_paragraphs(ftr.paragraphs)
-            for t in ftr.tables:
-                for row in t.rows:
-                    for cell in row.cells:
-                        process_paragraphs(cell.paragraphs)
-
     # Output path
     base, ext = os.path.splitext(in_path)
     if not out_path:
@@ -658,20 +955,24 @@ def apply_sentences_docx(in_path: str, out_path: str | None, sentences: List[str
 # =======
 
 def launch_gui() -> None:
-    if tk is None:
+    # GUI-only imports bind here so CLI runs never pay the tkinter cost
+    try:
+        import tkinter as tk
+        from tkinter import filedialog, messagebox, scrolledtext, ttk
+    except Exception:
         print("tkinter is not available in this environment.")
         sys.exit(3)
 
     root = tk.Tk()
     root.title("Fix Fonts - Sentence Mode")
 
-    # File selection
-    file_frame = tk.Frame(root)
+    # File selection (ttk widgets: lighter construction, native rendering)
+    file_frame = ttk.Frame(root)
     file_frame.pack(fill="x", padx=8, pady=6)
 
-    tk.Label(file_frame, text="Input .docx:").pack(side="left")
+    ttk.Label(file_frame, text="Input .docx:").pack(side="left")
     in_var = tk.StringVar(value="")
-    in_entry = tk.Entry(file_frame, textvariable=in_var, width=60)
+    in_entry = ttk.Entry(file_frame, textvariable=in_var, width=60)
     in_entry.pack(side="left", padx=6)
 
     def browse_in():
@@ -679,14 +980,14 @@ def launch_gui() -> None:
         if path:
             in_var.set(path)
 
-    tk.Button(file_frame, text="Browse", command=browse_in).pack(side="left")
+    ttk.Button(file_frame, text="Browse", command=browse_in).pack(side="left")
 
     # Output path (optional)
-    out_frame = tk.Frame(root)
+    out_frame = ttk.Frame(root)
     out_frame.pack(fill="x", padx=8, pady=0)
-    tk.Label(out_frame, text="Output .docx (optional):").pack(side="left")
+    ttk.Label(out_frame, text="Output .docx (optional):").pack(side="left")
     out_var = tk.StringVar(value="")
-    out_entry = tk.Entry(out_frame, textvariable=out_var, width=60)
+    out_entry = ttk.Entry(out_frame, textvariable=out_var, width=60)
     out_entry.pack(side="left", padx=6)
 
     def browse_out():
@@ -694,24 +995,24 @@ def launch_gui() -> None:
         if path:
             out_var.set(path)
 
-    tk.Button(out_frame, text="Save As", command=browse_out).pack(side="left")
+    ttk.Button(out_frame, text="Save As", command=browse_out).pack(side="left")
 
     # Text area for sentences
-    tk.Label(root, text="Enter English sentences (free text or one per line):").pack(anchor="w", padx=8, pady=(8, 0))
+    ttk.Label(root, text="Enter English sentences (free text or one per line):").pack(anchor="w", padx=8, pady=(8, 0))
     txt = scrolledtext.ScrolledText(root, width=90, height=12, wrap="word")
     txt.pack(fill="both", expand=True, padx=8, pady=6)
 
     # Status
     status_var = tk.StringVar(value="Ready")
-    status = tk.Label(root, textvariable=status_var, anchor="w")
+    status = ttk.Label(root, textvariable=status_var, anchor="w")
     status.pack(fill="x", padx=8, pady=(0, 6))
 
     # Actions
-    btn_frame = tk.Frame(root)
+    btn_frame = ttk.Frame(root)
     btn_frame.pack(fill="x", padx=8, pady=(0, 10))
 
     def do_split():
-        sentences = extract_sentences(txt.get("1.0", "end").strip())
+        sentences = list(extract_sentences(txt.get("1.0", "end").strip()))
         txt.delete("1.0", "end")
         txt.insert("1.0", "\n".join(sentences))
         status_var.set(f"Separated {len(sentences)} sentence(s)")
@@ -726,32 +1027,67 @@ def launch_gui() -> None:
         if not in_path:
             messagebox.showerror("Missing file", "Please choose an input .docx file.")
             return
+        # Reject bad paths before the parse-convert-save cycle starts
+        if not in_path.lower().endswith(".docx") or not os.path.isfile(in_path):
+            messagebox.showerror("Invalid file", f"Not an existing .docx file:\n{in_path}")
+            return
         raw = txt.get("1.0", "end").strip()
-        # Accept either one sentence per line or free text; split robustly
+        # Line-delimited input keeps line priority: multi-line text may mix
+        # terminated and unterminated lines, and the extractor would drop
+        # the latter. Only single-item input goes through the regex pass.
         sentences = [s for s in (line.strip() for line in raw.splitlines()) if s]
-        # If text wasn't line-separated, extract by regex
         if len(sentences) <= 1:
-            sentences = extract_sentences(raw)
+            sentences = list(extract_sentences(raw))
         if not sentences:
             messagebox.showwarning("No sentences", "Provide at least one sentence ending with .!? ")
             return
-        try:
-            status_var.set("Processing...")
-            root.update_idletasks()
-            written, converted = apply_sentences_docx(in_path, out_path, sentences)
+
+        # Run the conversion off the Tk thread so a multi-second document
+        # save does not freeze the window; results marshal back via after().
+        def _done(result):
+            written, converted = result
             status_var.set(f"Done. Converted {converted} match(es). Wrote: {written}")
+            convert_btn.config(state="normal")
             messagebox.showinfo("Success", f"Converted {converted} match(es).\nSaved: {written}")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+
+        def _fail(exc):
             status_var.set("Error: see popup")
+            convert_btn.config(state="normal")
+            messagebox.showerror("Error", str(exc))
+
+        def _worker():
+            try:
+                result = apply_sentences_docx(in_path, out_path, sentences)
+            except Exception as e:
+                root.after(0, partial(_fail, e))
+            else:
+                root.after(0, partial(_done, result))
+
+        def _start_worker():
+            threading.Thread(target=_worker, daemon=True).start()
 
-    tk.Button(btn_frame, text="Separate Sentences", command=do_split).pack(side="left")
-    tk.Button(btn_frame, text="Convert Fonts", command=do_convert).pack(side="left", padx=8)
-    tk.Button(btn_frame, text="Clear", command=do_clear).pack(side="left")
+        convert_btn.config(state="disabled")
+        status_var.set("Processing...")
+        # Start the worker on the next event-loop tick so the status label
+        # repaints before the thread competes for CPU; no idle-task flush.
+        root.after(10, _start_worker)
+
+    buttons = {}
+    for label, cmd in (("Separate Sentences", do_split),
+                       ("Convert Fonts", do_convert),
+                       ("Clear", do_clear)):
+        buttons[label] = btn = ttk.Button(btn_frame, text=label, command=cmd)
+        btn.pack(side="left", padx=4)
+    convert_btn = buttons["Convert Fonts"]
 
     root.mainloop()
 
 
+def _csv_sentences(value: str) -> List[str]:
+    """argparse type callback: split a comma-separated list, dropping empties."""
+    return [s for s in (x.strip() for x in value.split(",")) if s]
+
+
 def build_arg_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="Fix fonts in DOCX: English -> Times New Roman; other -> SutonnyMJ")
     p.add_argument("--in", dest="in_path", required=False, help="Input .docx file path")
@@ -759,16 +1095,18 @@ def build_arg_parser() -> argparse.ArgumentParser:
     p.add_argument("--threshold", dest="threshold", type=float, default=3.5,
                    help="Zipf frequency threshold for English detection (default: 3.5)")
     p.add_argument("--dry-run", dest="dry_run", action="store_true", help="Analyze only; do not write output")
+    p.add_argument("--fast", dest="fast", action="store_true",
+                   help="Rewrite the DOCX XML parts directly (lower memory, faster on large files)")
     p.add_argument("--verbose", dest="verbose", action="store_true", help="Enable DEBUG logging")
     p.add_argument("--gui", dest="gui", action="store_true", help="Launch GUI for sentence-based conversion")
-    p.add_argument("--sentences", dest="sentences", default=None,
+    p.add_argument("--sentences", dest="sentences", type=_csv_sentences, default=[],
                    help="Comma-separated English sentences to convert (exact matches)")
     p.add_argument("--sentences-file", dest="sentences_file", default=None,
                    help="Path to a text file containing sentences (one per line or free text)")
     return p
 
 
-def main(argv: List[str] | None = None) -> None:
+def main(argv: List[str] | None = None) -> int:
     parser = build_arg_parser()
     args = parser.parse_args(argv)
 
@@ -779,68 +1117,60 @@ def main(argv: List[str] | None = None) -> None:
 
     if getattr(args, "gui", False):
         launch_gui()
-        return
+        return 0
 
     # Sentence-based CLI mode
     if args.sentences or args.sentences_file:
         if not args.in_path:
             logging.error("--in is required when using --sentences or --sentences-file")
-            sys.exit(2)
+            return 2
+        if not args.in_path.lower().endswith(".docx") or not os.path.isfile(args.in_path):
+            logging.error("Not an existing .docx file: %s", args.in_path)
+            return 2
         sentences: List[str] = []
-        if args.sentences:
-            # Split on commas but allow commas inside quotes is overkill; keep simple
-            raw_items = [s.strip() for s in args.sentences.split(",")]
-            for item in raw_items:
-                if item:
-                    # If not clearly sentence-separated, extract via regex
-                    ext = extract_sentences(item)
-                    if ext:
-                        sentences.extend(ext)
-                    else:
-                        sentences.append(item)
+        for item in args.sentences:
+            # If not clearly sentence-separated, extract via regex
+            sentences.extend(list(extract_sentences(item)) or [item])
         if args.sentences_file:
             try:
-                with open(args.sentences_file, "r", encoding="utf-8") as fh:
-                    content = fh.read()
-                sentences.extend(extract_sentences(content))
+                sentences.extend(_iter_file_sentences(args.sentences_file))
             except Exception as e:
                 logging.error("Failed to read sentences file: %s", e)
-                sys.exit(2)
-        # Deduplicate and keep order
-        seen = set()
-        ordered: List[str] = []
-        for s in sentences:
-            s2 = s.strip()
-            if s2 and s2 not in seen:
-                ordered.append(s2)
-                seen.add(s2)
+                return 2
+        # Every source (_csv_sentences, extract_sentences,
+        # _iter_file_sentences) already yields stripped non-empty strings,
+        # so dedup is the only remaining step.
+        ordered = list(dict.fromkeys(sentences))
         if not ordered:
             logging.error("No valid sentences provided. Ensure they end with .!? ")
-            sys.exit(2)
+            return 2
         try:
             out_path, total = apply_sentences_docx(args.in_path, args.out_path, ordered)
-            logging.info("Sentence mode: converted %d match(es). Wrote: %s", total, out_path)
+            logging.info("Sentence mode: converted %d match(es) across %d sentence(s). Wrote: %s",
+                         total, len(ordered), out_path)
         except Exception as e:
             logging.error("Sentence processing failed: %s", e)
-            sys.exit(1)
-        return
+            return 1
+        return 0
 
     if not args.in_path:
         logging.error("--in is required for CLI mode (omit it when using --gui)")
-        sys.exit(2)
+        return 2
 
-    if _zipf_frequency is None:
+    if _get_zipf_frequency() is None:
         logging.error("wordfreq is required for non-sentence CLI mode. Install with: pip install wordfreq")
-        sys.exit(2)
+        return 2
 
     try:
-        convert_docx(args.in_path, args.out_path, args.threshold, args.dry_run)
+        convert = convert_docx_fast if args.fast else convert_docx
+        convert(args.in_path, args.out_path, args.threshold, args.dry_run)
     except FileNotFoundError:
-        sys.exit(2)
+        return 2
     except Exception as e:
         logging.error("Processing failed: %s", e)
-        sys.exit(1)
+        return 1
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -4,21 +4,19 @@ Test script to verify Bangla OCR application installation
 """
 
 import sys
-import importlib
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 
-def test_import(module_name, package_name=None):
-    """Test if a module can be imported"""
+def check_import(module_name):
+    """Return True if a module is installed, without executing it.
+
+    find_spec only consults the import machinery, so heavy packages like
+    Pillow are not actually loaded just to print a checkmark. Modules that
+    need runtime verification (Tesseract) keep their own real probe.
+    """
     try:
-        if package_name:
-            importlib.import_module(module_name)
-            print(f"✓ {package_name} imported successfully")
-            return True
-        else:
-            importlib.import_module(module_name)
-            print(f"✓ {module_name} imported successfully")
-            return True
-    except ImportError as e:
-        print(f"✗ {module_name} import failed: {e}")
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
         return False
 
 def test_tesseract():
@@ -58,9 +56,16 @@ def main():
         ("os", "Operating system interface")
     ]
     
+    # Probe concurrently (filesystem lookups overlap), print in order
+    with ThreadPoolExecutor(max_workers=len(modules)) as pool:
+        results = list(pool.map(check_import, (m for m, _ in modules)))
+
     all_modules_ok = True
-    for module, description in modules:
-        if not test_import(module, description):
+    for (module, description), ok in zip(modules, results):
+        if ok:
+            print(f"✓ {description} found successfully")
+        else:
+            print(f"✗ {module} is not installed")
             all_modules_ok = False
     
     print("\nTesting Tesseract OCR:")